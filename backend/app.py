@@ -1,19 +1,25 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 import os
-import docxToTxt as dx
-import pdfToTxt as px
-from parse_syllabus import extract_assignments_and_dates  # Updated imports
+import tempfile
+from parse_syllabus import extract_assignments_and_dates, extract_syllabus_events_from_text, build_report  # Updated imports
+from revisions import reparse_document
+from docstore import DocumentStore, content_id
 
 app = Flask(__name__)
 CORS(app)
 
-upload_folder = '../uploads'
-parsed_folder = '../parsed'
+# Overridable so load tests and other local runs can keep their files elsewhere
+upload_folder = os.environ.get('SYLLABUS_UPLOAD_FOLDER', '../uploads')
+parsed_folder = os.environ.get('SYLLABUS_PARSED_FOLDER', '../parsed')
 os.makedirs(upload_folder, exist_ok=True)
 os.makedirs(parsed_folder, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = upload_folder
 app.config['PARSED_FOLDER'] = parsed_folder
+# Parsed pages are kept compressed and content-addressed in the parsed folder
+app.config['DOCUMENT_STORE'] = DocumentStore(parsed_folder)
+
+ALLOWED_EXTENSIONS = ('docx', 'pdf', 'txt')
 
 @app.route("/upload", methods=['POST'])
 def upload_file():
@@ -24,31 +30,36 @@ def upload_file():
     if file.filename == '':
         return jsonify({"error": "No file selected for upload"}), 400
 
-    # Save the uploaded file
-    upload_path = os.path.join(app.config['UPLOAD_FOLDER'], file.filename)
-    file.save(upload_path)
-
-    # Determine file type and parse accordingly
+    # Determine file type
     file_extension = file.filename.split('.')[-1].lower()
-    parsed_filename = f"{os.path.splitext(file.filename)[0]}.txt"
-    parsed_path = os.path.join(app.config['PARSED_FOLDER'], parsed_filename)
+    if file_extension not in ALLOWED_EXTENSIONS:
+        return jsonify({"error": f"Unsupported file type: {file_extension}"}), 400
+
+    # The raw file is only needed while it is parsed; the document store keeps the
+    # parsed pages. Each request gets its own file, so concurrent uploads of the
+    # same bytes never share (or delete) one another's copy.
+    data = file.read()
+    doc_id = content_id(data)
+    with tempfile.NamedTemporaryFile(dir=app.config['UPLOAD_FOLDER'], prefix=f"{doc_id}.",
+                                     suffix=f".{file_extension}", delete=False) as f:
+        f.write(data)
+        upload_path = f.name
 
     try:
-        if file_extension == 'docx':
-            dx.parse_docx(upload_path, parsed_path)
-        elif file_extension == 'pdf':
-            px.parse_pdf(upload_path, parsed_path)
-        elif file_extension == 'txt':
-            # If it's already a txt file, just copy it
-            with open(upload_path, 'r') as src, open(parsed_path, 'w') as dst:
-                dst.write(src.read())
-        else:
-            return jsonify({"error": f"Unsupported file type: {file_extension}"}), 400
+        # Only pages that changed since the last upload of this file are re-extracted
+        # and re-scanned; the delta lets clients update their copies incrementally
+        result = reparse_document(upload_path, file_extension, app.config['DOCUMENT_STORE'],
+                                  file.filename, doc_id)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+    finally:
+        os.remove(upload_path)
 
-    return jsonify({"message": f"File parsed successfully: {parsed_filename}",
-                    "parsed_path": parsed_path}), 200
+    return jsonify({"message": f"File parsed successfully: {file.filename}",
+                    "doc_id": doc_id,
+                    "events": result['events'],
+                    "delta": result['delta'],
+                    "pages": result['pages']}), 200
 
 # @app.route("/parse-assignments", methods=['GET'])
 # def parse_assignments():
@@ -68,10 +79,32 @@ def upload_file():
 
 @app.route("/generate-report", methods=['GET'])
 def generate_report_endpoint():
+    doc_id = request.args.get('doc')
     file_path = request.args.get('file')
+
+    if doc_id:
+        # Optional comma-separated page numbers, e.g. pages=3,4
+        pages_arg = request.args.get('pages')
+        try:
+            pages = [int(page) for page in pages_arg.split(',')] if pages_arg else None
+        except ValueError:
+            return jsonify({"error": f"Invalid page list: {pages_arg}"}), 400
+
+        try:
+            text = app.config['DOCUMENT_STORE'].read_text(doc_id, pages)
+        except (ValueError, IndexError) as e:
+            return jsonify({"error": str(e)}), 400
+        except FileNotFoundError:
+            return jsonify({"error": f"Document not found: {doc_id}"}), 404
+
+        try:
+            report = build_report(extract_syllabus_events_from_text(text, doc_id))
+            return jsonify(report), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
     
     if not file_path:
-        return jsonify({"error": "No file path provided"}), 400
+        return jsonify({"error": "No document id or file path provided"}), 400
 
     if not os.path.exists(file_path):
         return jsonify({"error": f"File not found: {file_path}"}), 404
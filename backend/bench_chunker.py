@@ -0,0 +1,108 @@
+import argparse
+import os
+import time
+from typing import Dict, List, Tuple
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_community.document_loaders import TextLoader
+from langchain_community.vectorstores import FAISS
+from langchain_huggingface import HuggingFaceEmbeddings
+
+from chunker import SyllabusChunker
+
+# (question, text the retrieved context must contain to count as a hit)
+DEFAULT_QUERIES = [
+    ("When is Lab 7 due?", "10/22"),
+    ("What is Lab 9 about?", "BeautifulSoup"),
+    ("When is the midterm project?", "10/8"),
+    ("When is the final project due?", "12/10"),
+    ("When are the final presentations?", "12/3"),
+    ("Is there class during fall break?", "Fall Break"),
+    ("What are the professor's office hours?", "Tuesdays 6:00"),
+    ("Who is the teaching assistant?", "Haitao Lyu"),
+    ("How are grades weighted?", "35% Laboratory Exercises"),
+    ("What is the late work policy?", "10% per day"),
+    ("What grade is 90-92 points?", "90-92 points = A-"),
+    ("Can I record the lectures?", "prohibited from recording"),
+]
+
+
+def load_documents(directory_path: str, file_extension: str = '.txt') -> List:
+    """
+    Load every text file in a directory, the same way TextChatbot does.
+    """
+    documents = []
+    for name in sorted(os.listdir(directory_path)):
+        if name.endswith(file_extension):
+            loader = TextLoader(os.path.join(directory_path, name), encoding='utf-8')
+            documents.extend(loader.load())
+    return documents
+
+
+def run_benchmark(splitter, documents: List, embeddings, queries: List[Tuple[str, str]],
+                  top_k: int = 3) -> Dict[str, float]:
+    """
+    Chunk, embed and query a corpus with one splitter.
+
+    Returns:
+        dict: Chunk statistics, embedding time and retrieval hit rate
+    """
+    start = time.perf_counter()
+    chunks = splitter.split_documents(documents)
+    split_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorstore = FAISS.from_documents(chunks, embeddings)
+    embed_time = time.perf_counter() - start
+
+    hits = 0
+    for question, expected in queries:
+        results = vectorstore.similarity_search(question, k=top_k)
+        if any(expected.lower() in doc.page_content.lower() for doc in results):
+            hits += 1
+
+    total_chars = sum(len(chunk.page_content) for chunk in chunks)
+    source_chars = sum(len(doc.page_content) for doc in documents)
+    return {
+        'chunks': len(chunks),
+        'avg_chars': total_chars / len(chunks) if chunks else 0.0,
+        'redundancy': total_chars / source_chars - 1 if source_chars else 0.0,
+        'split_s': split_time,
+        'embed_s': embed_time,
+        'hit_rate': hits / len(queries) if queries else 0.0,
+    }
+
+
+def main():
+    """
+    Compare the structure-aware chunker against the previous recursive splitter
+    """
+    parser = argparse.ArgumentParser(description="Benchmark syllabus chunking strategies")
+    parser.add_argument('directory', nargs='?', default='../textfiles',
+                        help="Directory of parsed syllabus .txt files")
+    parser.add_argument('--top-k', type=int, default=3, help="Chunks retrieved per query")
+    args = parser.parse_args()
+
+    documents = load_documents(args.directory)
+    print(f"Loaded {len(documents)} documents from {args.directory}")
+
+    embeddings = HuggingFaceEmbeddings(model_name='sentence-transformers/all-MiniLM-L6-v2')
+    # Warm up the model so the first splitter is not charged for loading it
+    embeddings.embed_query("warm up")
+
+    splitters = {
+        'recursive(500/100)': RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=100),
+        'syllabus': SyllabusChunker(),
+    }
+
+    print(f"{'splitter':<20}{'chunks':>8}{'avg chars':>11}{'overlap':>9}"
+          f"{'split s':>9}{'embed s':>9}{'hit rate':>10}")
+    for name, splitter in splitters.items():
+        stats = run_benchmark(splitter, documents, embeddings, DEFAULT_QUERIES, args.top_k)
+        print(f"{name:<20}{stats['chunks']:>8}{stats['avg_chars']:>11.0f}"
+              f"{stats['redundancy']:>9.1%}{stats['split_s']:>9.3f}"
+              f"{stats['embed_s']:>9.2f}{stats['hit_rate']:>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+from langchain_community.vectorstores import FAISS
+from langchain_huggingface import HuggingFaceEmbeddings
+
+from bench_chunker import DEFAULT_QUERIES, load_documents
+from chunker import SyllabusChunker
+from retrieval import HybridRetriever
+
+
+def run_benchmark(search: Callable[[str, int], List], queries: List[Tuple[str, str]],
+                  top_k: int = 3, repeats: int = 5) -> Dict[str, float]:
+    """
+    Measure recall@k and per-query latency of one retrieval strategy.
+
+    Returns:
+        dict: 'recall', 'mean_ms' and 'p95_ms'
+    """
+    hits = 0
+    latencies = []
+    for question, expected in queries:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            results = search(question, top_k)
+            latencies.append((time.perf_counter() - start) * 1000)
+        if any(expected.lower() in doc.page_content.lower() for doc in results):
+            hits += 1
+
+    latencies.sort()
+    return {
+        'recall': hits / len(queries) if queries else 0.0,
+        'mean_ms': sum(latencies) / len(latencies) if latencies else 0.0,
+        'p95_ms': latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0,
+    }
+
+
+def main():
+    """
+    Compare dense-only, BM25-only and hybrid retrieval over the same chunks
+    """
+    parser = argparse.ArgumentParser(description="Benchmark syllabus retrieval strategies")
+    parser.add_argument('directory', nargs='?', default='../textfiles',
+                        help="Directory of parsed syllabus .txt files")
+    parser.add_argument('--top-k', type=int, default=3, help="Chunks retrieved per query")
+    args = parser.parse_args()
+
+    documents = load_documents(args.directory)
+    chunks = SyllabusChunker().split_documents(documents)
+    for chunk_id, chunk in enumerate(chunks):
+        chunk.metadata['chunk_id'] = chunk_id
+    print(f"Indexed {len(chunks)} chunks from {len(documents)} documents in {args.directory}")
+
+    embeddings = HuggingFaceEmbeddings(model_name='sentence-transformers/all-MiniLM-L6-v2')
+    vectorstore = FAISS.from_documents(chunks, embeddings)
+    hybrid = HybridRetriever(chunks, vectorstore)
+    lexical = HybridRetriever(chunks)
+
+    # Count how often the hybrid retriever can skip the embedding call entirely
+    fast_path = 0
+    for question, _ in DEFAULT_QUERIES:
+        hybrid.search(question, args.top_k)
+        fast_path += hybrid.last_strategy == 'lexical'
+
+    strategies = {
+        'dense': lambda query, k: vectorstore.similarity_search(query, k=k),
+        'bm25': lexical.search,
+        'hybrid': hybrid.search,
+    }
+
+    print(f"{'strategy':<10}{'recall@k':>10}{'mean ms':>10}{'p95 ms':>10}")
+    for name, search in strategies.items():
+        stats = run_benchmark(search, DEFAULT_QUERIES, args.top_k)
+        print(f"{name:<10}{stats['recall']:>10.0%}{stats['mean_ms']:>10.2f}{stats['p95_ms']:>10.2f}")
+    print(f"hybrid answered {fast_path}/{len(DEFAULT_QUERIES)} queries from the lexical fast path")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,23 @@
 import os
 # import torch
 from transformers import AutoTokenizer, AutoModelForCausalLM, BitsAndBytesConfig
-from langchain_community.document_loaders import TextLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
+from ingest import EMBEDDING_MODEL, EmbeddingPipeline, embedding_model_kwargs, load_store_documents
+from docstore import DocumentStore
+from retrieval import HybridRetriever
 # from typing import List, Dict
 
 
 class TextChatbot:
-    def __init__(self, model_path: str = "meta-llama/Llama-2-7b-chat-hf"):
+    def __init__(self, model_path: str = "meta-llama/Llama-2-7b-chat-hf",
+                 embedding_workers: int = None, use_onnx: bool = False):
         """
         Initialize the chatbot with a Llama model and text file processing capabilities.
         
         :param model_path: Path to the Llama model
+        :param embedding_workers: Number of processes used to embed documents (default: half the cores)
+        :param use_onnx: Embed with the int8 ONNX export of the embedding model
         """
 
         # Load tokenizer and model
@@ -26,9 +30,17 @@ class TextChatbot:
         
         # Embedding and vector store components
         self.embeddings = HuggingFaceEmbeddings(
-            model_name='sentence-transformers/all-MiniLM-L6-v2'
+            model_name=EMBEDDING_MODEL,
+            model_kwargs=embedding_model_kwargs(use_onnx)
+        )
+        self.embedding_pipeline = EmbeddingPipeline(
+            model_name=EMBEDDING_MODEL,
+            workers=embedding_workers,
+            use_onnx=use_onnx,
+            embeddings=self.embeddings
         )
         self.vectorstore = None
+        self.retriever = None
         
     def load_txt_files_from_directory(self, directory_path: str, file_extension: str = '.txt') -> None:
         """
@@ -37,14 +49,6 @@ class TextChatbot:
         :param directory_path: Path to the directory containing text files
         :param file_extension: File extension to filter (default is '.txt')
         """
-        all_documents = []
-        
-        # Load and split text files
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=500,
-            chunk_overlap=100
-        )
-        
         # Validate directory path
         if not os.path.isdir(directory_path):
             print(f"Error: {directory_path} is not a valid directory.")
@@ -60,41 +64,61 @@ class TextChatbot:
         # Print number of files found
         print(f"Found {len(txt_paths)} text files in {directory_path}")
         
-        for txt_path in txt_paths:
-            try:
-                # Load text file
-                loader = TextLoader(txt_path, encoding='utf-8')
-                documents = loader.load()
-                
-                # Split documents into chunks
-                splits = text_splitter.split_documents(documents)
-                all_documents.extend(splits)
-            except Exception as e:
-                print(f"Error loading {txt_path}: {e}")
-        
-        # Create vector store from document chunks
+        # Load, chunk and embed the files, overlapping loading with batched embedding
+        self._index(*self.embedding_pipeline.run(txt_paths))
+        
+    def load_documents_from_store(self, store_path: str) -> None:
+        """
+        Load and process the latest version of every document in a parsed document store.
+        
+        :param store_path: Path to the store directory written by the backend (e.g. '../parsed')
+        """
+        if not os.path.isdir(store_path):
+            print(f"Error: {store_path} is not a valid directory.")
+            return
+        
+        store = DocumentStore(store_path)
+        print(f"Found {len(store.names())} documents in {store_path}")
+        
+        documents = load_store_documents(store)
+        self._index(*self.embedding_pipeline.run_documents(documents, len(store.names())))
+        
+    def _index(self, all_documents, vectors, stats) -> None:
+        """
+        Build the vector store and lexical index from embedded document chunks.
+        """
+        # Create vector store from the precomputed chunk embeddings
         if all_documents:
-            self.vectorstore = FAISS.from_documents(
-                all_documents, 
-                self.embeddings
+            # chunk_id ties FAISS results back to the lexical index
+            for chunk_id, doc in enumerate(all_documents):
+                doc.metadata['chunk_id'] = chunk_id
+            
+            self.vectorstore = FAISS.from_embeddings(
+                [(doc.page_content, vector) for doc, vector in zip(all_documents, vectors.tolist())],
+                self.embeddings,
+                metadatas=[doc.metadata for doc in all_documents]
             )
-            print(f"Successfully loaded and processed {len(all_documents)} document chunks.")
+            # BM25 inverted index over the same chunks
+            self.retriever = HybridRetriever(all_documents, self.vectorstore)
+            print(f"Successfully loaded and processed {len(all_documents)} document chunks "
+                  f"({stats['chunks_per_sec']:.1f} chunks/sec).")
         else:
             print("No documents were loaded. Please check your directory and file types.")
         
-    def retrieve_context(self, query: str, top_k: int = 3) -> str:
+    def retrieve_context(self, query: str, top_k: int = 3, filters: dict = None) -> str:
         """
         Retrieve relevant context from loaded documents.
         
         :param query: User's query
         :param top_k: Number of top relevant documents to retrieve
+        :param filters: Optional metadata filters, e.g. {'course': 'GISC4317'}
         :return: Retrieved context as a string
         """
-        if not self.vectorstore:
+        if not self.retriever:
             return "No documents have been loaded."
         
-        # Retrieve top k most similar document chunks
-        results = self.vectorstore.similarity_search(query, k=top_k)
+        # Retrieve top k chunks by exact-term match, falling back to lexical + vector fusion
+        results = self.retriever.search(query, top_k=top_k, filters=filters)
         context = "\n".join([doc.page_content for doc in results])
         
         return context
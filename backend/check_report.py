@@ -0,0 +1,106 @@
+import argparse
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+from pypdf import PdfReader
+
+import pdfToTxt as px
+from docstore import DocumentStore, content_id
+from parse_syllabus import build_report, extract_syllabus_events_from_text
+
+SAMPLE_PDF = '../uploads/4317Syllabus-chastain2.pdf'
+SAMPLE_TXT = '../textfiles/sample.txt'
+SAMPLE_YEAR = 2024
+
+# Report expected for the sample syllabus (the demo report the endpoint used to hard-code)
+EXPECTED_ASSIGNMENTS = [
+    ("Lab 0", "2024-08-27"), ("Lab 1", "2024-09-03"), ("Lab 2", "2024-09-10"),
+    ("Lab 3", "2024-09-17"), ("Lab 4", "2024-09-24"), ("Lab 5", "2024-10-01"),
+    ("Lab 6", "2024-10-08"), ("Lab 12", "2024-10-22"), ("Lab 7", "2024-10-29"),
+    ("Lab 8", "2024-11-05"), ("Lab 9", "2024-11-12"), ("Lab 10", "2024-11-19"),
+    ("Lab 11", "2024-11-26"),
+]
+EXPECTED_IMPORTANT_DATES = [
+    ("Midterm Project", "2024-10-08"),
+    ("Final Presentations Due", "2024-12-03"),
+    ("Final Project Due", "2024-12-10"),
+]
+
+
+def report_pairs(report: Dict[str, List[Dict[str, str]]]) -> Dict[str, List[tuple]]:
+    """
+    Reduce a report to (name, date) pairs; 'details' depends on today's date.
+    """
+    return {
+        'upcoming_assignments': [(item['name'], item['due_date'])
+                                 for item in report['upcoming_assignments']],
+        'important_dates': [(item['event'], item['date']) for item in report['important_dates']],
+    }
+
+
+def check(label: str, text: str, pages: Optional[List[int]] = None) -> bool:
+    """
+    Compare the report built from text with the expected report.
+
+    :param pages: Page numbers the text was restricted to; the expectation is then
+                  limited to the events on those pages of the sample syllabus
+    """
+    expected = {
+        'upcoming_assignments': EXPECTED_ASSIGNMENTS,
+        'important_dates': EXPECTED_IMPORTANT_DATES,
+    }
+    if pages == [3]:
+        expected = {
+            'upcoming_assignments': EXPECTED_ASSIGNMENTS[:7],
+            'important_dates': EXPECTED_IMPORTANT_DATES[:1],
+        }
+    elif pages == [4]:
+        expected = {
+            'upcoming_assignments': EXPECTED_ASSIGNMENTS[7:],
+            'important_dates': EXPECTED_IMPORTANT_DATES[1:],
+        }
+
+    actual = report_pairs(build_report(extract_syllabus_events_from_text(text, label, SAMPLE_YEAR)))
+    if actual == expected:
+        print(f"ok      {label}")
+        return True
+
+    print(f"FAILED  {label}")
+    for key in expected:
+        if actual[key] != expected[key]:
+            print(f"  {key}:\n    expected {expected[key]}\n    actual   {actual[key]}")
+    return False
+
+
+def main():
+    """
+    Check that the sample syllabus still produces the expected report
+    """
+    parser = argparse.ArgumentParser(description="Regression check for /generate-report on the sample syllabus")
+    parser.add_argument('--pdf', default=SAMPLE_PDF, help="Sample syllabus PDF")
+    parser.add_argument('--txt', default=SAMPLE_TXT, help="Flattened text of the same syllabus")
+    args = parser.parse_args()
+
+    with open(args.txt, 'r', encoding='utf-8') as f:
+        flattened = f.read()
+
+    # Read the text back through a document store, as /generate-report does
+    with tempfile.TemporaryDirectory() as store_dir:
+        store = DocumentStore(store_dir)
+        with open(args.pdf, 'rb') as f:
+            doc_id = content_id(f.read())
+        page_texts = [px.clean_page_text(page.extract_text()) for page in PdfReader(args.pdf).pages]
+        store.put(doc_id, page_texts, {'name': args.pdf})
+
+        results = [
+            check('pdf', store.read_text(doc_id)),
+            check('pdf pages=3', store.read_text(doc_id, [3]), pages=[3]),
+            check('pdf pages=4', store.read_text(doc_id, [4]), pages=[4]),
+            check('txt', flattened),
+        ]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == '__main__':
+    main()
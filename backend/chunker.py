@@ -0,0 +1,218 @@
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+# Marker written by pdfToTxt.parse_pdf before each page
+PAGE_MARKER_PATTERN = re.compile(r'^--- Page (\d+) ---$', re.MULTILINE)
+# Page header left in text extracted without markers, e.g. "GISC4317 Course Syllabus Page 3"
+INLINE_PAGE_PATTERN = re.compile(r'^.{0,80}?\bPage (\d+)\b')
+# Course codes such as "GISC4317" or "CS 1337"
+COURSE_PATTERN = re.compile(r'\b([A-Z]{2,4})\s?(\d{4})\b')
+# Schedule rows start with a m/d date or a week number
+ROW_START_PATTERN = re.compile(r'^(?:\d{1,2}/\d{1,2}\b|Week \d+\b)', re.IGNORECASE)
+ROW_DATE_PATTERN = re.compile(r'(?<![\d/])\d{1,2}/\d{1,2}(?![\d/])')
+# Section titles that end a schedule table even without a blank line after it
+SECTION_HEADING_PATTERN = re.compile(
+    r'^(?:academic calendar|course (?:information|description|policies|schedule|materials|objectives)'
+    r'|grading(?: policy| scale)?|class (?:attendance|participation|recordings)|late work'
+    r'|office hours|(?:required|suggested) (?:textbooks?|course materials)|textbooks?'
+    r'|(?:student )?learning (?:objectives|outcomes)|exams?|final exam)\b',
+    re.IGNORECASE)
+SENTENCE_BREAK_PATTERN = re.compile(r'(?<=[.!?])\s+(?=[A-Z•])|\s+(?=•)')
+
+
+class SyllabusChunker:
+    def __init__(self, max_chars: int = 800, min_chars: int = 200):
+        """
+        Split parsed syllabus text into chunks that follow the document's structure.
+
+        Chunks never cross a page boundary, schedule rows and sentences are never
+        cut in half, and a new headed section starts a new chunk once the current
+        one is reasonably sized. No text is repeated between chunks.
+
+        :param max_chars: Upper bound on chunk size (all-MiniLM-L6-v2 truncates past ~256 tokens)
+        :param min_chars: Chunks smaller than this are merged with the next section
+        """
+        self.max_chars = max_chars
+        self.min_chars = min_chars
+
+    def split_documents(self, documents: List[Document]) -> List[Document]:
+        """
+        Split loaded documents into chunks, mirroring TextSplitter.split_documents.
+
+        Each chunk carries the original metadata plus 'page', 'section' and 'course'.
+        """
+        chunks = []
+        for document in documents:
+            for text, metadata in self.split_text(document.page_content,
+                                                  document.metadata.get('source', '')):
+                chunks.append(Document(page_content=text,
+                                       metadata={**document.metadata, **metadata}))
+        return chunks
+
+    def split_text(self, text: str, source: str = '') -> List[Tuple[str, Dict]]:
+        """
+        Split a syllabus into (chunk_text, metadata) pairs.
+        """
+        course_match = COURSE_PATTERN.search(text)
+        course = ''.join(course_match.groups()) if course_match else ''
+        base_metadata = {
+            'source': source,
+            'document': os.path.basename(source),
+            'course': course,
+        }
+
+        results = []
+        # Sections such as the schedule often continue onto the next page
+        section = ''
+        for page, page_text in self._split_pages(text):
+            current = []
+            current_len = 0
+            current_section = section
+            # Whether the current chunk contains a heading of its own
+            current_headed = False
+
+            def flush():
+                if current:
+                    results.append(('\n'.join(current),
+                                    {**base_metadata, 'page': page, 'section': current_section}))
+
+            for unit, is_heading in self._units(page_text):
+                if is_heading:
+                    section = unit
+                    # Start headed sections on a fresh chunk unless the current one is tiny;
+                    # a tiny chunk with no heading yet (e.g. just the page header) takes this one
+                    if current_len >= self.min_chars:
+                        flush()
+                        current, current_len = [], 0
+                    elif not current_headed:
+                        current_section = section
+                    current_headed = True
+
+                for piece in self._fit(unit):
+                    if current and current_len + len(piece) + 1 > self.max_chars:
+                        flush()
+                        current, current_len = [], 0
+                    if not current:
+                        current_section = section
+                        current_headed = is_heading
+                    current.append(piece)
+                    current_len += len(piece) + 1
+
+            flush()
+
+        return results
+
+    def _split_pages(self, text: str) -> Iterator[Tuple[Optional[int], str]]:
+        """
+        Yield (page_number, page_text) using parse_pdf markers when present,
+        otherwise blank-line separated blocks with an inline "Page N" header.
+        """
+        markers = list(PAGE_MARKER_PATTERN.finditer(text))
+        if markers:
+            for marker, next_marker in zip(markers, markers[1:] + [None]):
+                end = next_marker.start() if next_marker else len(text)
+                yield int(marker.group(1)), text[marker.end():end].strip()
+            return
+
+        for block in re.split(r'\n\s*\n', text):
+            block = block.strip()
+            if block:
+                page_match = INLINE_PAGE_PATTERN.match(block)
+                yield (int(page_match.group(1)) if page_match else None), block
+
+    def _units(self, page_text: str) -> Iterator[Tuple[str, bool]]:
+        """
+        Yield the indivisible units of a page as (text, is_heading).
+
+        Schedule rows absorb their wrapped continuation lines until the next row,
+        a blank line or a known section heading; long flattened lines are broken
+        into schedule rows or sentences.
+        """
+        row = None
+        for line in page_text.split('\n'):
+            line = line.strip()
+            if not line:
+                # A blank line ends the current schedule row
+                if row:
+                    yield row, False
+                    row = None
+                continue
+
+            if ROW_START_PATTERN.match(line):
+                if row:
+                    yield row, False
+                row = line
+                continue
+
+            if row is not None:
+                # Wrapped table cells ("Introduction to Python", "Lab 1: employing") look
+                # like headings; only a known section heading closes the row early
+                if self._is_heading(line) and SECTION_HEADING_PATTERN.match(line):
+                    yield row, False
+                    row = None
+                    yield line, True
+                elif len(row) + len(line) < self.max_chars:
+                    row = f"{row} {line}"
+                else:
+                    yield row, False
+                    row = line
+                continue
+
+            if self._is_heading(line):
+                yield line, True
+                continue
+
+            for piece in self._split_long_line(line):
+                yield piece, False
+
+        if row:
+            yield row, False
+
+    def _is_heading(self, line: str) -> bool:
+        # The running page header ("GISC4317 Course Syllabus  Page 3") is not a section
+        if INLINE_PAGE_PATTERN.match(line):
+            return False
+        if not (len(line) <= 60 and line[0].isupper() and line[-1] not in '.,;:'
+                and not ROW_DATE_PATTERN.search(line) and len(line.split()) <= 8):
+            return False
+        # All-caps lines are usually table column headers ("ACTIVITY DUE DATE")
+        return not line.isupper() or bool(SECTION_HEADING_PATTERN.match(line))
+
+    def _split_long_line(self, line: str) -> List[str]:
+        """
+        Break a flattened line into schedule rows when it holds a table, else into sentences.
+        """
+        if len(line) <= self.max_chars:
+            return [line]
+
+        dates = list(ROW_DATE_PATTERN.finditer(line))
+        if len(dates) >= 3:
+            starts = [0] + [match.start() for match in dates if match.start() > 0]
+            return [line[start:end].strip()
+                    for start, end in zip(starts, starts[1:] + [len(line)])
+                    if line[start:end].strip()]
+
+        return [piece for piece in SENTENCE_BREAK_PATTERN.split(line) if piece]
+
+    def _fit(self, unit: str) -> List[str]:
+        """
+        Hard-wrap a single unit that is still longer than max_chars at word boundaries.
+        """
+        if len(unit) <= self.max_chars:
+            return [unit]
+
+        pieces = []
+        words = []
+        length = 0
+        for word in unit.split():
+            if words and length + len(word) + 1 > self.max_chars:
+                pieces.append(' '.join(words))
+                words, length = [], 0
+            words.append(word)
+            length += len(word) + 1
+        if words:
+            pieces.append(' '.join(words))
+        return pieces
@@ -0,0 +1,266 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; pages fall back to zlib
+    zstandard = None
+
+# File layout: header, then one (offset, length) entry per page, then the compressed pages
+MAGIC = b'SYLP'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBI')  # magic, version, codec, flags, page count
+INDEX_ENTRY = struct.Struct('<QI')  # offset of the compressed page, compressed length
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+FLAG_PAGED = 1  # pages came from a PDF and are joined with "--- Page N ---" markers
+
+PAGES_SUFFIX = '.pages'
+MANIFEST_SUFFIX = '.json'
+NAMES_FILE = 'names.json'
+
+
+def content_id(data: bytes) -> str:
+    """
+    Name a document after the SHA-256 of its uploaded bytes.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def format_pages(page_texts: Iterable[str], paged: bool = True) -> str:
+    """
+    Join page texts into the layout written by pdfToTxt.parse_pdf.
+    """
+    if not paged:
+        return ''.join(page_texts)
+    return ''.join(f"--- Page {page_num} ---\n{page_text}\n\n"
+                   for page_num, page_text in enumerate(page_texts, 1))
+
+
+class StoredDocument:
+    def __init__(self, path: str):
+        """
+        Memory-map a stored document for random page access.
+
+        Only the header and page index are parsed up front; each page is
+        decompressed when it is requested.
+
+        :param path: Path to the .pages file
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.codec, flags, self.page_count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"Not a parsed document store file: {path}")
+        if self.codec == CODEC_ZSTD and zstandard is None:
+            self._mmap.close()
+            raise RuntimeError(f"{path} is zstd-compressed but the zstandard package is not installed")
+        self.paged = bool(flags & FLAG_PAGED)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_page(self, page_num: int) -> str:
+        """
+        Return the text of one page (1-based).
+        """
+        if not 1 <= page_num <= self.page_count:
+            raise IndexError(f"Page {page_num} out of range (1-{self.page_count})")
+
+        offset, length = INDEX_ENTRY.unpack_from(self._mmap, HEADER.size + (page_num - 1) * INDEX_ENTRY.size)
+        data = self._mmap[offset:offset + length]
+        if self.codec == CODEC_ZSTD:
+            return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+        return zlib.decompress(data).decode('utf-8')
+
+    def iter_pages(self, pages: Optional[Iterable[int]] = None) -> Iterator[str]:
+        for page_num in (pages if pages is not None else range(1, self.page_count + 1)):
+            yield self.get_page(page_num)
+
+    def read_text(self, pages: Optional[List[int]] = None) -> str:
+        """
+        Return the selected pages (default: all) in the parse_pdf text layout.
+
+        DOCX and TXT documents are stored as a single page 1.
+
+        :raises IndexError: If a requested page does not exist
+        """
+        if pages is None:
+            return format_pages(self.iter_pages(), self.paged)
+        if not self.paged:
+            return ''.join(self.iter_pages(pages))
+        return ''.join(f"--- Page {page_num} ---\n{self.get_page(page_num)}\n\n"
+                       for page_num in pages)
+
+
+class DocumentStore:
+    def __init__(self, root: str, codec: Optional[int] = None, level: int = 9):
+        """
+        Content-addressed store of parsed documents, compressed page by page.
+
+        Each document is one '<sha256>.pages' file holding a page/offset index and
+        the individually compressed pages, plus a '<sha256>.json' manifest of page
+        hashes and extracted events. names.json maps each uploaded filename to its
+        latest version; older versions are dropped when they are replaced.
+
+        :param root: Directory holding the store
+        :param codec: CODEC_ZSTD or CODEC_ZLIB (defaults to zstd when installed)
+        :param level: Compression level
+        """
+        self.root = root
+        self.codec = codec or (CODEC_ZSTD if zstandard is not None else CODEC_ZLIB)
+        self.level = level
+        self._lock = threading.Lock()
+        # Ids that in-flight uploads are about to publish; never dropped
+        self._reserved = Counter()
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, doc_id: str, suffix: str) -> str:
+        # Document ids are hex digests; reject anything that could escape the store
+        if not doc_id or not all(c in '0123456789abcdef' for c in doc_id):
+            raise ValueError(f"Invalid document id: {doc_id}")
+        return os.path.join(self.root, doc_id + suffix)
+
+    def _compress(self, text: str) -> bytes:
+        data = text.encode('utf-8')
+        if self.codec == CODEC_ZSTD:
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        return zlib.compress(data, self.level)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def exists(self, doc_id: str) -> bool:
+        return os.path.exists(self._path(doc_id, PAGES_SUFFIX))
+
+    def put(self, doc_id: str, page_texts: List[str], manifest: Dict, paged: bool = True) -> None:
+        """
+        Store the pages and manifest of a document.
+        """
+        blobs = [self._compress(text) for text in page_texts]
+        offset = HEADER.size + INDEX_ENTRY.size * len(blobs)
+        parts = [HEADER.pack(MAGIC, VERSION, self.codec, FLAG_PAGED if paged else 0, len(blobs))]
+        for blob in blobs:
+            parts.append(INDEX_ENTRY.pack(offset, len(blob)))
+            offset += len(blob)
+        parts.extend(blobs)
+
+        self._write_atomic(self._path(doc_id, PAGES_SUFFIX), b''.join(parts))
+        self._write_atomic(self._path(doc_id, MANIFEST_SUFFIX), json.dumps(manifest).encode('utf-8'))
+
+    def open(self, doc_id: str) -> StoredDocument:
+        """
+        Open a document for page access; use as a context manager.
+
+        :raises FileNotFoundError: If the document is not in the store
+        """
+        return StoredDocument(self._path(doc_id, PAGES_SUFFIX))
+
+    def read_text(self, doc_id: str, pages: Optional[List[int]] = None) -> str:
+        with self.open(doc_id) as document:
+            return document.read_text(pages)
+
+    def load_manifest(self, doc_id: str) -> Optional[Dict]:
+        try:
+            with open(self._path(doc_id, MANIFEST_SUFFIX), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _load_names(self) -> Dict[str, str]:
+        try:
+            with open(os.path.join(self.root, NAMES_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def latest(self, name: str) -> Optional[str]:
+        """
+        Return the id of the most recent version uploaded under a filename.
+        """
+        return self._load_names().get(name)
+
+    @contextmanager
+    def reserve(self, doc_id: str):
+        """
+        Keep doc_id from being dropped while an upload checks, stores and publishes it.
+
+        If the upload fails before publishing, an unreferenced document is dropped
+        when the last reservation is released.
+        """
+        with self._lock:
+            self._reserved[doc_id] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved[doc_id] -= 1
+                if not self._reserved[doc_id]:
+                    del self._reserved[doc_id]
+                    if doc_id not in self._load_names().values():
+                        self.delete(doc_id)
+
+    def set_latest(self, name: str, doc_id: str, page_texts: Optional[List[str]] = None,
+                   manifest: Optional[Dict] = None, paged: bool = True) -> Optional[str]:
+        """
+        Make doc_id the latest version of name and drop the version it replaces.
+
+        Only the latest version of each filename is kept; a replaced version is
+        deleted unless another filename still points at the same content or an
+        upload has reserved it.
+
+        :param page_texts: Pages of doc_id, stored again if the document has gone
+                           missing since the caller checked for it
+        :param manifest: Manifest stored with page_texts
+        :param paged: Passed to put() with page_texts
+        :return: Id of the dropped version, or None if nothing was dropped
+        """
+        with self._lock:
+            if page_texts is not None and not self.exists(doc_id):
+                self.put(doc_id, page_texts, manifest or {}, paged)
+
+            names = self._load_names()
+            previous_id = names.get(name)
+            names[name] = doc_id
+            self._write_atomic(os.path.join(self.root, NAMES_FILE),
+                               json.dumps(names, indent=2).encode('utf-8'))
+
+            if (previous_id is None or previous_id in names.values()
+                    or previous_id in self._reserved):
+                return None
+            self.delete(previous_id)
+            return previous_id
+
+    def delete(self, doc_id: str) -> None:
+        """
+        Remove a document's pages and manifest (readers that already opened it keep working).
+        """
+        for suffix in (PAGES_SUFFIX, MANIFEST_SUFFIX):
+            try:
+                os.remove(self._path(doc_id, suffix))
+            except FileNotFoundError:
+                pass
+
+    def names(self) -> Dict[str, str]:
+        return self._load_names()
@@ -1,6 +1,19 @@
 from docx import Document
 import logging
 
+def extract_docx_text(file_path):
+    """
+    Extract the non-empty paragraphs of a DOCX file, one per line.
+    
+    Args:
+        file_path (str): Path to the input DOCX file
+    
+    Returns:
+        str: Extracted text
+    """
+    doc = Document(file_path)
+    return ''.join(para.text + '\n' for para in doc.paragraphs if para.text.strip())
+
 def parse_docx(file_path, output_path):
     """
     Convert a DOCX file to a plain text file.
@@ -10,16 +23,9 @@ def parse_docx(file_path, output_path):
         output_path (str): Path to save the extracted text file
     """
     try:
-        # Open the Word document
-        doc = Document(file_path)
-        
-        # Open output text file
+        # Write paragraphs, ensuring each paragraph is on a new line
         with open(output_path, 'w', encoding='utf-8') as f:
-            # Write paragraphs, ensuring each paragraph is on a new line
-            for para in doc.paragraphs:
-                # Only write non-empty paragraphs
-                if para.text.strip():
-                    f.write(para.text + '\n')
+            f.write(extract_docx_text(file_path))
         
         print(f"Successfully converted DOCX to text: {output_path}")
     
@@ -0,0 +1,218 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+# Event kinds are stored as small integer codes in EventBatch
+EVENT_KINDS = ('date', 'assignment', 'important')
+_KIND_CODES = {kind: code for code, kind in enumerate(EVENT_KINDS)}
+
+
+@dataclass(slots=True, frozen=True)
+class Event:
+    """
+    A single dated syllabus event.
+
+    Attributes:
+        date (date): Calendar date of the event
+        title (str): Short name, e.g. "Lab 3" or "Midterm Project"
+        details (str): Surrounding context or extra description
+        kind (str): One of EVENT_KINDS
+        source (str): Document the event was extracted from
+    """
+    date: date
+    title: str
+    details: str = ''
+    kind: str = 'date'
+    source: str = ''
+
+
+class EventBatch:
+    """
+    Columnar collection of events backed by numpy arrays.
+
+    Dates are stored as datetime64[D], kinds as int8 codes into EVENT_KINDS and
+    text columns as object arrays, so sorting, filtering and merging are array
+    operations instead of per-event Python work, and the columns can be handed
+    to pandas or pyarrow without converting row by row.
+    """
+    __slots__ = ('dates', 'titles', 'details', 'kinds', 'sources')
+
+    def __init__(self, dates: np.ndarray, titles: np.ndarray, details: np.ndarray,
+                 kinds: np.ndarray, sources: np.ndarray):
+        self.dates = dates.astype('datetime64[D]', copy=False)
+        self.titles = titles
+        self.details = details
+        self.kinds = kinds.astype(np.int8, copy=False)
+        self.sources = sources
+
+    @classmethod
+    def empty(cls) -> 'EventBatch':
+        return cls(np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=object),
+                   np.empty(0, dtype=object), np.empty(0, dtype=np.int8),
+                   np.empty(0, dtype=object))
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event]) -> 'EventBatch':
+        """
+        Build a batch from Event records.
+        """
+        events = list(events)
+        count = len(events)
+        if not count:
+            return cls.empty()
+
+        titles = np.empty(count, dtype=object)
+        details = np.empty(count, dtype=object)
+        sources = np.empty(count, dtype=object)
+        titles[:] = [event.title for event in events]
+        details[:] = [event.details for event in events]
+        sources[:] = [event.source for event in events]
+
+        return cls(
+            np.array([event.date for event in events], dtype='datetime64[D]'),
+            titles,
+            details,
+            np.fromiter((_KIND_CODES[event.kind] for event in events), dtype=np.int8, count=count),
+            sources,
+        )
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, str]], date_key: str = 'date',
+                     title_key: str = 'context', source: str = '') -> 'EventBatch':
+        """
+        Build a batch from the list-of-dicts shape produced by to_records.
+        """
+        count = len(records)
+        if not count:
+            return cls.empty()
+
+        titles = np.empty(count, dtype=object)
+        titles[:] = [record[title_key] for record in records]
+        details = np.empty(count, dtype=object)
+        details[:] = ''
+        sources = np.empty(count, dtype=object)
+        sources[:] = source
+
+        return cls(
+            np.array([record[date_key] for record in records], dtype='datetime64[D]'),
+            titles,
+            details,
+            np.zeros(count, dtype=np.int8),
+            sources,
+        )
+
+    @classmethod
+    def concat(cls, batches: Iterable['EventBatch']) -> 'EventBatch':
+        """
+        Merge several batches into one without materializing Event objects.
+        """
+        batches = [batch for batch in batches if len(batch)]
+        if not batches:
+            return cls.empty()
+        return cls(
+            np.concatenate([batch.dates for batch in batches]),
+            np.concatenate([batch.titles for batch in batches]),
+            np.concatenate([batch.details for batch in batches]),
+            np.concatenate([batch.kinds for batch in batches]),
+            np.concatenate([batch.sources for batch in batches]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __iter__(self) -> Iterator[Event]:
+        for day, title, details, kind, source in zip(self.dates.tolist(), self.titles,
+                                                     self.details, self.kinds.tolist(),
+                                                     self.sources):
+            yield Event(day, title, details, EVENT_KINDS[kind], source)
+
+    def take(self, indices: np.ndarray) -> 'EventBatch':
+        """
+        Select events by integer index array or boolean mask.
+        """
+        return EventBatch(self.dates[indices], self.titles[indices], self.details[indices],
+                          self.kinds[indices], self.sources[indices])
+
+    def sort(self) -> 'EventBatch':
+        """
+        Return the events ordered by date (stable, so extraction order breaks ties).
+        """
+        return self.take(np.argsort(self.dates, kind='stable'))
+
+    def of_kind(self, kind: str) -> 'EventBatch':
+        return self.take(self.kinds == _KIND_CODES[kind])
+
+    def between(self, start: Optional[date] = None, end: Optional[date] = None) -> 'EventBatch':
+        """
+        Return events with start <= date <= end (either bound may be omitted).
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self.dates >= np.datetime64(start, 'D')
+        if end is not None:
+            mask &= self.dates <= np.datetime64(end, 'D')
+        return self.take(mask)
+
+    def dedupe(self) -> 'EventBatch':
+        """
+        Drop repeated (date, title) pairs, keeping the first occurrence.
+        """
+        if len(self) < 2:
+            return self
+        _, title_codes = np.unique(self.titles.astype(str), return_inverse=True)
+        day_codes = self.dates.astype(np.int64)
+        keys = (day_codes - day_codes.min()) * (int(title_codes.max()) + 1) + title_codes
+        _, first_index = np.unique(keys, return_index=True)
+        return self.take(np.sort(first_index))
+
+    def days_until(self, today: Optional[date] = None) -> np.ndarray:
+        """
+        Number of days from today to each event (negative when already past).
+        """
+        today = np.datetime64(today or date.today(), 'D')
+        return (self.dates - today).astype(np.int64)
+
+    def iso_dates(self) -> np.ndarray:
+        """
+        Dates formatted as YYYY-MM-DD strings.
+        """
+        return np.datetime_as_string(self.dates, unit='D')
+
+    def to_records(self, date_key: str = 'date', title_key: str = 'context') -> List[Dict[str, str]]:
+        """
+        Convert to the list-of-dicts shape used by the JSON endpoints.
+        """
+        return [
+            {date_key: day, title_key: title}
+            for day, title in zip(self.iso_dates().tolist(), self.titles)
+        ]
+
+    def to_pandas(self):
+        """
+        Convert to a pandas DataFrame, sharing the column arrays.
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            'date': self.dates.astype('datetime64[s]'),
+            'title': self.titles,
+            'details': self.details,
+            'kind': pd.Categorical.from_codes(self.kinds, categories=list(EVENT_KINDS)),
+            'source': self.sources,
+        })
+
+    def to_arrow(self):
+        """
+        Convert to a pyarrow Table with a date32 column and dictionary-encoded kinds.
+        """
+        import pyarrow as pa
+
+        return pa.table({
+            'date': pa.array(self.dates, type=pa.date32()),
+            'title': pa.array(self.titles, type=pa.string()),
+            'details': pa.array(self.details, type=pa.string()),
+            'kind': pa.DictionaryArray.from_arrays(pa.array(self.kinds), pa.array(EVENT_KINDS)),
+            'source': pa.array(self.sources, type=pa.string()),
+        })
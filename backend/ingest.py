@@ -0,0 +1,229 @@
+import argparse
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from langchain_community.document_loaders import TextLoader
+from langchain_core.documents import Document
+
+from chunker import SyllabusChunker
+from docstore import DocumentStore
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+# int8-quantized ONNX export published in the all-MiniLM-L6-v2 model repository
+ONNX_INT8_FILE = 'onnx/model_quint8_avx2.onnx'
+
+# Model loaded once per worker process by _init_worker
+_worker_model = None
+
+
+def embedding_model_kwargs(use_onnx: bool = False, onnx_file: str = ONNX_INT8_FILE) -> Dict:
+    """
+    SentenceTransformer keyword arguments for the torch or ONNX int8 backend.
+
+    Pass the same kwargs to HuggingFaceEmbeddings(model_kwargs=...) so queries are
+    embedded by the same model as the indexed chunks.
+    """
+    if not use_onnx:
+        return {}
+    return {'backend': 'onnx', 'model_kwargs': {'file_name': onnx_file}}
+
+
+def _load_model(model_name: str, model_kwargs: Dict):
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name, device='cpu', **model_kwargs)
+
+
+def _encode(model, texts: List[str], batch_size: int) -> np.ndarray:
+    return model.encode(texts, batch_size=batch_size, convert_to_numpy=True,
+                        show_progress_bar=False).astype(np.float32, copy=False)
+
+
+def _init_worker(model_name: str, model_kwargs: Dict, threads: int) -> None:
+    """
+    Load the embedding model once in each worker process.
+    """
+    global _worker_model
+    import torch
+
+    # Split the cores between workers instead of letting each one grab all of them
+    torch.set_num_threads(threads)
+    _worker_model = _load_model(model_name, model_kwargs)
+
+
+def _embed_batch(texts: List[str], batch_size: int) -> np.ndarray:
+    return _encode(_worker_model, texts, batch_size)
+
+
+class EmbeddingPipeline:
+    def __init__(self, model_name: str = EMBEDDING_MODEL, workers: Optional[int] = None,
+                 batch_size: int = 128, use_onnx: bool = False, splitter=None,
+                 embeddings=None):
+        """
+        Load, chunk and embed text files, overlapping file loading with embedding.
+
+        Files are read and chunked in the calling process while batches of chunks
+        are embedded concurrently in a pool of CPU worker processes.
+
+        :param model_name: SentenceTransformer model used for the embeddings
+        :param workers: Number of embedding processes (defaults to half the CPU cores;
+                        0 or 1 embeds in the calling process)
+        :param batch_size: Number of chunks sent to a worker per job and encoded per forward pass
+        :param use_onnx: Embed with the int8-quantized ONNX export instead of torch
+        :param splitter: Object with split_documents() (defaults to SyllabusChunker)
+        :param embeddings: Already loaded LangChain embeddings used when embedding in the
+                           calling process, so the model is not loaded a second time
+        """
+        cpu_count = os.cpu_count() or 1
+        self.model_name = model_name
+        self.workers = max(1, cpu_count // 2) if workers is None else workers
+        self.threads_per_worker = max(1, cpu_count // max(1, self.workers))
+        self.batch_size = batch_size
+        self.model_kwargs = embedding_model_kwargs(use_onnx)
+        self.splitter = splitter or SyllabusChunker()
+        self.embeddings = embeddings
+        self._local_model = None
+
+    def _load_documents(self, paths: List[str]) -> Iterator[Document]:
+        """
+        Yield documents file by file so embedding can start before all files are read.
+        """
+        for path in paths:
+            try:
+                yield from TextLoader(path, encoding='utf-8').load()
+            except Exception as e:
+                logger.error(f"Error loading {path}: {e}")
+
+    def _batches(self, documents: Iterable[Document]) -> Iterator[List[Document]]:
+        batch = []
+        for document in documents:
+            for chunk in self.splitter.split_documents([document]):
+                batch.append(chunk)
+                if len(batch) == self.batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def _embed_local(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a batch in the calling process, leaving its torch thread settings alone.
+        """
+        if self.embeddings is not None:
+            return np.asarray(self.embeddings.embed_documents(texts), dtype=np.float32)
+        if self._local_model is None:
+            self._local_model = _load_model(self.model_name, self.model_kwargs)
+        return _encode(self._local_model, texts, self.batch_size)
+
+    def run(self, paths: List[str]) -> Tuple[List[Document], np.ndarray, Dict[str, float]]:
+        """
+        Embed every chunk of the given files.
+
+        Returns:
+            tuple: (chunks, float32 embedding matrix in chunk order, stats dict with
+                    'files', 'chunks', 'seconds' and 'chunks_per_sec')
+        """
+        return self.run_documents(self._load_documents(paths), len(paths))
+
+    def run_documents(self, documents: Iterable[Document],
+                      file_count: int = 0) -> Tuple[List[Document], np.ndarray, Dict[str, float]]:
+        """
+        Embed every chunk of already loaded (or lazily produced) documents.
+
+        Returns:
+            tuple: Same as run()
+        """
+        start = time.perf_counter()
+        chunks = []
+        vectors = []
+
+        if self.workers <= 1:
+            for batch in self._batches(documents):
+                chunks.extend(batch)
+                vectors.append(self._embed_local([doc.page_content for doc in batch]))
+        else:
+            # spawn, not fork: the parent may already hold torch threads (e.g. the chat model)
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                     initializer=_init_worker,
+                                     initargs=(self.model_name, self.model_kwargs,
+                                               self.threads_per_worker)) as executor:
+                # Bound the number of queued batches so memory stays flat on large corpora
+                pending = deque()
+                for batch in self._batches(documents):
+                    if len(pending) >= 2 * self.workers:
+                        vectors.append(pending.popleft().result())
+                    chunks.extend(batch)
+                    pending.append(executor.submit(
+                        _embed_batch, [doc.page_content for doc in batch], self.batch_size))
+                while pending:
+                    vectors.append(pending.popleft().result())
+
+        embeddings = np.vstack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+        seconds = time.perf_counter() - start
+        stats = {
+            'files': file_count,
+            'chunks': len(chunks),
+            'seconds': seconds,
+            'chunks_per_sec': len(chunks) / seconds if seconds > 0 else 0.0,
+        }
+        return chunks, embeddings, stats
+
+
+def load_store_documents(store: DocumentStore) -> Iterator[Document]:
+    """
+    Yield the latest version of every document in a parsed document store.
+    """
+    for name, doc_id in sorted(store.names().items()):
+        try:
+            yield Document(page_content=store.read_text(doc_id),
+                           metadata={'source': name, 'doc_id': doc_id})
+        except Exception as e:
+            logger.error(f"Error loading {name} ({doc_id}): {e}")
+
+
+def main():
+    """
+    Embed a directory of parsed syllabi and report throughput
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Embed parsed syllabi and report chunks/sec")
+    parser.add_argument('directory', nargs='?', default='../textfiles',
+                        help="Directory of parsed syllabus .txt files")
+    parser.add_argument('--workers', type=int, default=None, help="Embedding processes")
+    parser.add_argument('--batch-size', type=int, default=128, help="Chunks per batch")
+    parser.add_argument('--onnx', action='store_true', help="Use the int8 ONNX export")
+    parser.add_argument('--store', action='store_true',
+                        help="Treat the directory as a parsed document store (e.g. ../parsed)")
+    args = parser.parse_args()
+
+    pipeline = EmbeddingPipeline(workers=args.workers, batch_size=args.batch_size,
+                                 use_onnx=args.onnx)
+    if args.store:
+        store = DocumentStore(args.directory)
+        _, embeddings, stats = pipeline.run_documents(load_store_documents(store),
+                                                      len(store.names()))
+    else:
+        paths = [
+            os.path.join(args.directory, f)
+            for f in sorted(os.listdir(args.directory))
+            if f.endswith('.txt')
+        ]
+        _, embeddings, stats = pipeline.run(paths)
+
+    print(f"Embedded {stats['chunks']} chunks from {stats['files']} files "
+          f"in {stats['seconds']:.2f}s ({stats['chunks_per_sec']:.1f} chunks/sec, "
+          f"{pipeline.workers} workers, batch size {pipeline.batch_size})")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,86 +1,167 @@
+import os
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from events import Event, EventBatch
 
-def extract_assignments_and_dates(file_path: str) -> Dict[str, List[Dict[str, str]]]:
+# Marker written by pdfToTxt.parse_pdf before each page
+PAGE_MARKER_PATTERN = re.compile(r'^--- page \d+ ---$', re.IGNORECASE)
+# Schedule rows start with a m/d date
+ROW_DATE_PATTERN = re.compile(r'(?<![\d/])(\d{1,2}/\d{1,2})(?![\d/])')
+LAB_PATTERN = re.compile(r'\blab (\d+)\b')
+DUE_DATE_PATTERN = re.compile(r'\b(?:due date|due|deadline):?\s*(\d{1,2}/\d{1,2})')
+IMPORTANT_DATE_PATTERN = re.compile(r'midterm project|final presentations due|final project due')
+
+def extract_syllabus_events(file_path: str, default_year: Optional[int] = None) -> EventBatch:
     """
-    Extract important dates and upcoming assignments from a syllabus text file.
+    Extract lab assignments and major project dates from a syllabus text file.
 
     Args:
         file_path (str): Path to the parsed syllabus text file.
+        default_year (int): Year for the m/d dates in the syllabus (defaults to the current year).
 
     Returns:
-        dict: A dictionary containing 'important_dates' and 'upcoming_assignments'.
+        EventBatch: Assignments (kind 'assignment') and important dates (kind 'important').
     """
-    important_dates = []
-    upcoming_assignments = []
-
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read().lower()
-
-            # Pattern for extracting assignments and due dates
-            assignment_pattern = r"(lab \d+):.*?(?:due date|deadline)?\s*(\d{1,2}/\d{1,2})"
-            matches = re.findall(assignment_pattern, content)
-
-            for match in matches:
-                name, date_str = match
-                try:
-                    due_date = datetime.strptime(date_str, "%m/%d")
-                    due_date = due_date.replace(year=datetime.now().year)  # Assume current year
-                    days_until_due = (due_date - datetime.now()).days
-                    assignment = {
-                        "name": name.title(),
-                        "due_date": due_date.strftime("%Y-%m-%d"),
-                        "details": f"Due in {days_until_due} days" if days_until_due > 0 else "Overdue",
-                    }
-                    upcoming_assignments.append(assignment)
-                except ValueError:
-                    continue  # Skip invalid dates
-
-            # Extract important dates (e.g., Midterm, Final Project)
-            important_date_pattern = r"(midterm project|final presentations due|final project due).*?(\d{1,2}/\d{1,2})"
-            matches = re.findall(important_date_pattern, content)
-
-            for match in matches:
-                event, date_str = match
-                try:
-                    event_date = datetime.strptime(date_str, "%m/%d")
-                    event_date = event_date.replace(year=datetime.now().year)  # Assume current year
-                    important_dates.append({
-                        "event": event.title(),
-                        "date": event_date.strftime("%Y-%m-%d"),
-                    })
-                except ValueError:
-                    continue  # Skip invalid dates
+            return extract_syllabus_events_from_text(file.read(), os.path.basename(file_path),
+                                                     default_year)
 
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
     except Exception as e:
         raise RuntimeError(f"Error processing syllabus: {e}")
 
+def split_schedule_rows(text: str) -> List[Tuple[str, str]]:
+    """
+    Split syllabus text into schedule rows anchored on their leading m/d date.
+
+    A row runs from its date to the next row start, a blank line or a page marker,
+    so table cells wrapped onto several lines stay with their row (the same rule
+    SyllabusChunker uses). Lines holding three or more dates are flattened tables
+    and start a new row at every date.
+
+    Args:
+        text (str): Syllabus content.
+
+    Returns:
+        list: (m/d date, lower-cased row text) tuples in document order.
+    """
+    rows = []
+    row = None
+    for line in text.split('\n'):
+        line = line.strip().lower()
+        if not line or PAGE_MARKER_PATTERN.match(line):
+            row = None
+            continue
+
+        dates = list(ROW_DATE_PATTERN.finditer(line))
+        if len(dates) >= 3:
+            starts = [match.start() for match in dates]
+        else:
+            starts = [match.start() for match in dates[:1] if match.start() == 0]
+
+        # Text before the first row start continues the open row, if any
+        head = line[:starts[0]] if starts else line
+        if row is not None and head.strip():
+            row[1].append(head.strip())
+
+        for start, end in zip(starts, starts[1:] + [len(line)]):
+            date_match = ROW_DATE_PATTERN.match(line, start)
+            row = [date_match.group(1), [line[date_match.end():end].strip()]]
+            rows.append(row)
+
+    return [(date_str, ' '.join(part for part in parts if part)) for date_str, parts in rows]
+
+def extract_syllabus_events_from_text(text: str, source: str = '',
+                                      default_year: Optional[int] = None) -> EventBatch:
+    """
+    Extract lab assignments and major project dates from syllabus text.
+
+    Labs listed on a schedule row are due at the next class meeting (the next
+    row's date) unless the row states a due date; important events take the date
+    of their own row.
+
+    Args:
+        text (str): Syllabus content (the whole document or selected pages).
+        source (str): Document name recorded on each event.
+        default_year (int): Year for the m/d dates in the syllabus (defaults to the current year).
+
+    Returns:
+        EventBatch: Assignments (kind 'assignment') and important dates (kind 'important').
+    """
+    default_year = default_year or datetime.now().year  # Assume current year
+    rows = split_schedule_rows(text)
+    events = []
+
+    def to_date(date_str):
+        try:
+            return datetime.strptime(f"{date_str}/{default_year}", "%m/%d/%Y").date()
+        except ValueError:
+            return None  # Skip invalid dates
+
+    for index, (row_date, row_text) in enumerate(rows):
+        # Assignments and their due dates
+        due_match = DUE_DATE_PATTERN.search(row_text)
+        if due_match:
+            due_str = due_match.group(1)
+        elif index + 1 < len(rows):
+            due_str = rows[index + 1][0]
+        else:
+            due_str = row_date
+        due_date = to_date(due_str)
+        if due_date is not None:
+            for number in LAB_PATTERN.findall(row_text):
+                events.append(Event(due_date, f"Lab {number}", kind='assignment', source=source))
+
+        # Important dates (e.g., Midterm, Final Project)
+        event_date = to_date(row_date)
+        if event_date is not None:
+            for event in IMPORTANT_DATE_PATTERN.findall(row_text):
+                events.append(Event(event_date, event.title(), kind='important', source=source))
+
+    return EventBatch.from_events(events)
+
+def extract_assignments_and_dates(file_path: str) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Extract important dates and upcoming assignments from a syllabus text file.
+
+    Args:
+        file_path (str): Path to the parsed syllabus text file.
+
+    Returns:
+        dict: A dictionary containing 'important_dates' and 'upcoming_assignments'.
+    """
+    return build_report(extract_syllabus_events(file_path))
+
+def build_report(events: EventBatch) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Build the assignments/important-dates report from extracted syllabus events.
+
+    Args:
+        events (EventBatch): Output of extract_syllabus_events or extract_syllabus_events_from_text.
+
+    Returns:
+        dict: A dictionary containing 'important_dates' and 'upcoming_assignments'.
+    """
     # Sort assignments and dates by due date
-    upcoming_assignments.sort(key=lambda x: x["due_date"])
-    important_dates.sort(key=lambda x: x["date"])
+    events = events.sort()
+
+    assignments = events.of_kind('assignment')
+    upcoming_assignments = [
+        {
+            "name": name,
+            "due_date": due_date,
+            "details": f"Due in {days_until_due} days" if days_until_due > 0 else "Overdue",
+        }
+        for name, due_date, days_until_due in zip(assignments.titles,
+                                                  assignments.iso_dates().tolist(),
+                                                  assignments.days_until().tolist())
+    ]
+    important_dates = events.of_kind('important').to_records(date_key="date", title_key="event")
 
     return {
-        "upcoming_assignments": [
-            { "name": "Lab 0", "due_date": "2024-08-27", "details": "Overdue" },
-            { "name": "Lab 1", "due_date": "2024-09-03", "details": "Overdue" },
-            { "name": "Lab 2", "due_date": "2024-09-10", "details": "Overdue" },
-            { "name": "Lab 3", "due_date": "2024-09-17", "details": "Overdue" },
-            { "name": "Lab 4", "due_date": "2024-09-24", "details": "Overdue" },
-            { "name": "Lab 5", "due_date": "2024-10-01", "details": "Overdue" },
-            { "name": "Lab 6", "due_date": "2024-10-08", "details": "Overdue" },
-            { "name": "Lab 12", "due_date": "2024-10-22", "details": "Overdue" },
-            { "name": "Lab 7", "due_date": "2024-10-29", "details": "Overdue" },
-            { "name": "Lab 8", "due_date": "2024-11-05", "details": "Overdue" },
-            { "name": "Lab 9", "due_date": "2024-11-12", "details": "Overdue" },
-            { "name": "Lab 10", "due_date": "2024-11-19", "details": "Overdue" },
-            { "name": "Lab 11", "due_date": "2024-11-26", "details": "Overdue" },
-            
-        ],
-        "important_dates": [{"event": "Midterm Project", "date": "2024-10-08"},
-                            { "event": "Final Project Presentation", "date": "2024-12-03" },
-                            { "event": "Final Project Due", "date": "2024-12-10" }]
+        "upcoming_assignments": upcoming_assignments,
+        "important_dates": important_dates,
     }
@@ -3,6 +3,26 @@ import os
 import logging
 import scanner
 
+def clean_page_text(page_text):
+    """
+    Remove excessive whitespace from extracted page text while preserving line breaks.
+    """
+    lines = [line.strip() for line in page_text.split('\n') if line.strip()]
+    return '\n'.join(lines)
+
+def write_pages(page_texts, output_path):
+    """
+    Write cleaned page texts to a text file, each preceded by a page marker.
+    
+    Args:
+        page_texts (list): Cleaned text of each page, in page order
+        output_path (str): Path to save the text file
+    """
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for page_num, page_text in enumerate(page_texts, 1):
+            f.write(f"--- Page {page_num} ---\n")
+            f.write(page_text + '\n\n')
+
 def parse_pdf(file_path, output_path):
     """
     Parse PDF file and extract text with improved handling of formatting and layout.
@@ -22,21 +42,9 @@ def parse_pdf(file_path, output_path):
         # Open the PDF file
         pdf = PdfReader(file_path)
         
-        # Open output text file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # Process each page
-            for page_num, page in enumerate(pdf.pages, 1):
-                # Extract text from the page
-                page_text = page.extract_text()
-                
-                # More sophisticated text cleaning
-                # Remove excessive whitespace while preserving some formatting
-                lines = [line.strip() for line in page_text.split('\n') if line.strip()]
-                cleaned_text = '\n'.join(lines)
-                
-                # Write page content
-                f.write(f"--- Page {page_num} ---\n")
-                f.write(cleaned_text + '\n\n')
+        # Extract and clean the text of each page
+        page_texts = [clean_page_text(page.extract_text()) for page in pdf.pages]
+        write_pages(page_texts, output_path)
                 
         logger.info(f"Successfully converted PDF to text: {output_path}")
         return output_path
@@ -0,0 +1,186 @@
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+# Dates like "10/08" and numbered items like "lab 7" are matched as single exact terms
+DATE_TERM_PATTERN = re.compile(r'(?<![\d/])(\d{1,2})/(\d{1,2})(?![\d/])')
+NUMBERED_TERM_PATTERN = re.compile(r'\b([a-z]+)\s+(\d+)\b(?!/)')
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'at', 'be', 'by', 'can', 'do', 'does', 'for', 'from', 'how',
+    'i', 'in', 'is', 'it', 'my', 'of', 'on', 'or', 'the', 'there', 'to', 'was', 'we',
+    'what', 'when', 'where', 'which', 'who', 'will', 'with',
+})
+
+
+def tokenize(text: str) -> Tuple[List[str], List[str]]:
+    """
+    Split text into (word terms, exact terms).
+
+    Exact terms are normalized dates ("10/8") and numbered items ("lab 7").
+    """
+    text = text.lower()
+    # Drop leading zeros so "10/08" and "10/8" match
+    exact_terms = [f"{int(month)}/{int(day)}" for month, day in DATE_TERM_PATTERN.findall(text)]
+    exact_terms.extend(f"{name} {int(number)}" for name, number in NUMBERED_TERM_PATTERN.findall(text)
+                       if name not in STOPWORDS)
+    words = [word for word in WORD_PATTERN.findall(text) if word not in STOPWORDS]
+    return words, exact_terms
+
+
+class BM25Index:
+    def __init__(self, documents: List[Document], k1: float = 1.2, b: float = 0.75,
+                 filter_fields: Tuple[str, ...] = ('course', 'document')):
+        """
+        Build an in-memory BM25 inverted index over document chunks.
+
+        Postings are stored as numpy arrays of chunk ids and term frequencies so a
+        query is scored with a handful of array operations per term.
+
+        :param documents: Chunks to index; position in the list is the chunk id
+        :param k1: BM25 term-frequency saturation
+        :param b: BM25 length normalization
+        :param filter_fields: Metadata fields that can be used to restrict a search
+        """
+        self.k1 = k1
+        self.b = b
+        self.size = len(documents)
+
+        postings = defaultdict(dict)
+        lengths = np.zeros(self.size, dtype=np.float32)
+        field_ids = {field: defaultdict(list) for field in filter_fields}
+
+        for doc_id, document in enumerate(documents):
+            words, exact_terms = tokenize(document.page_content)
+            lengths[doc_id] = len(words)
+            for term in words + exact_terms:
+                postings[term][doc_id] = postings[term].get(doc_id, 0) + 1
+            for field, ids in field_ids.items():
+                value = document.metadata.get(field)
+                if value:
+                    ids[value].append(doc_id)
+
+        self.lengths = lengths
+        self.avg_length = float(lengths.mean()) if self.size else 0.0
+        self.postings = {
+            term: (np.fromiter(counts.keys(), dtype=np.int32, count=len(counts)),
+                   np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+            for term, counts in postings.items()
+        }
+        self.field_ids = {
+            field: {value: np.array(ids, dtype=np.int32) for value, ids in values.items()}
+            for field, values in field_ids.items()
+        }
+
+    def _filter_mask(self, filters: Optional[Dict[str, str]]) -> Optional[np.ndarray]:
+        """
+        Boolean mask of chunks matching every metadata filter, or None for no filtering.
+        """
+        if not filters:
+            return None
+        mask = np.ones(self.size, dtype=bool)
+        for field, value in filters.items():
+            field_mask = np.zeros(self.size, dtype=bool)
+            field_mask[self.field_ids.get(field, {}).get(value, np.empty(0, dtype=np.int32))] = True
+            mask &= field_mask
+        return mask
+
+    def search(self, query: str, top_k: int = 3,
+               filters: Optional[Dict[str, str]] = None) -> List[Tuple[int, float]]:
+        """
+        Return up to top_k (chunk_id, score) pairs with a positive BM25 score.
+        """
+        if not self.size:
+            return []
+
+        words, exact_terms = tokenize(query)
+        scores = np.zeros(self.size, dtype=np.float32)
+        norm = self.k1 * (1 - self.b + self.b * self.lengths / max(self.avg_length, 1e-9))
+
+        for term in set(words + exact_terms):
+            if term not in self.postings:
+                continue
+            ids, tfs = self.postings[term]
+            idf = np.log(1 + (self.size - len(ids) + 0.5) / (len(ids) + 0.5))
+            scores[ids] += idf * tfs * (self.k1 + 1) / (tfs + norm[ids])
+
+        mask = self._filter_mask(filters)
+        if mask is not None:
+            scores[~mask] = 0
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k)[:top_k]]
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in order]
+
+    def has_exact_terms(self, query: str) -> bool:
+        """
+        True if the query contains a date or numbered item that occurs in the index.
+        """
+        _, exact_terms = tokenize(query)
+        return any(term in self.postings for term in exact_terms)
+
+
+class HybridRetriever:
+    def __init__(self, documents: List[Document], vectorstore=None,
+                 confidence_margin: float = 1.5, rrf_k: int = 60):
+        """
+        Combine BM25 and FAISS retrieval over the same chunks.
+
+        Queries with an exact date or numbered item that BM25 ranks decisively are
+        answered from the inverted index alone; everything else is answered by
+        reciprocal rank fusion of the lexical and dense rankings.
+
+        :param documents: Chunks that were added to the vector store, in the same order
+        :param vectorstore: LangChain vector store, or None for lexical-only retrieval
+        :param confidence_margin: Top BM25 score must beat the runner-up by this factor
+                                  to skip dense search
+        :param rrf_k: Rank offset used by reciprocal rank fusion
+        """
+        self.documents = documents
+        self.vectorstore = vectorstore
+        self.confidence_margin = confidence_margin
+        self.rrf_k = rrf_k
+        self.index = BM25Index(documents)
+        # Strategy used by the most recent search: 'lexical' or 'hybrid'
+        self.last_strategy = None
+
+    def _is_confident(self, query: str, lexical: List[Tuple[int, float]]) -> bool:
+        if not lexical or not self.index.has_exact_terms(query):
+            return False
+        if len(lexical) == 1:
+            return True
+        return lexical[0][1] >= self.confidence_margin * lexical[1][1]
+
+    def search(self, query: str, top_k: int = 3,
+               filters: Optional[Dict[str, str]] = None) -> List[Document]:
+        """
+        Retrieve the top_k chunks for a query.
+
+        :param query: User's query
+        :param top_k: Number of chunks to return
+        :param filters: Metadata filters such as {'course': 'GISC4317'} or {'document': 'x.txt'}
+        :return: Matching chunks, best first
+        """
+        fetch_k = max(top_k * 4, 10)
+        lexical = self.index.search(query, fetch_k, filters)
+
+        if self.vectorstore is None or self._is_confident(query, lexical):
+            self.last_strategy = 'lexical'
+            return [self.documents[doc_id] for doc_id, _ in lexical[:top_k]]
+
+        self.last_strategy = 'hybrid'
+        dense = self.vectorstore.similarity_search(query, k=fetch_k, filter=filters)
+
+        fused = defaultdict(float)
+        for rank, (doc_id, _) in enumerate(lexical):
+            fused[doc_id] += 1 / (self.rrf_k + rank + 1)
+        for rank, document in enumerate(dense):
+            fused[document.metadata['chunk_id']] += 1 / (self.rrf_k + rank + 1)
+
+        ranked = sorted(fused, key=fused.get, reverse=True)[:top_k]
+        return [self.documents[doc_id] for doc_id in ranked]
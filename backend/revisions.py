@@ -0,0 +1,233 @@
+import hashlib
+import logging
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pypdf import PdfReader
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+import docxToTxt as dx
+import pdfToTxt as px
+from docstore import DocumentStore
+from events import EventBatch
+from scanner import extract_events_from_text
+
+logger = logging.getLogger(__name__)
+
+
+def page_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _object_digest(obj, memo: Dict[Tuple[int, int], bytes]) -> bytes:
+    """
+    Digest a PDF object together with everything it references.
+
+    Indirect objects are digested once per document and memoized, so fonts and
+    images shared by many pages are only read once.
+    """
+    if isinstance(obj, IndirectObject):
+        key = (obj.idnum, obj.generation)
+        if key not in memo:
+            memo[key] = b''  # Guards against reference cycles
+            memo[key] = _object_digest(obj.get_object(), memo)
+        return memo[key]
+
+    hasher = hashlib.sha256()
+    if isinstance(obj, StreamObject):
+        hasher.update(b'stream')
+        hasher.update(_object_digest(DictionaryObject(obj), memo))
+        hasher.update(obj.get_data())
+    elif isinstance(obj, DictionaryObject):
+        hasher.update(b'dict')
+        for name in sorted(obj):
+            # /Parent points back up the page tree, which would pull in every page
+            if name != '/Parent':
+                hasher.update(name.encode('utf-8'))
+                hasher.update(_object_digest(obj.raw_get(name), memo))
+    elif isinstance(obj, ArrayObject):
+        hasher.update(b'array')
+        for item in obj:
+            hasher.update(_object_digest(item, memo))
+    else:
+        hasher.update(repr(obj).encode('utf-8'))
+    return hasher.digest()
+
+
+def _resources_digest(page, memo: Dict[Tuple[int, int], bytes]) -> bytes:
+    # /Resources may be inherited from an ancestor in the page tree
+    node = page
+    while node is not None:
+        if '/Resources' in node:
+            return _object_digest(node.raw_get('/Resources'), memo)
+        parent = node.get('/Parent')
+        node = parent.get_object() if parent is not None else None
+    return b''
+
+
+def _document_pages(upload_path: str, file_extension: str) -> List[Tuple[str, Callable[[], str]]]:
+    """
+    List the pages of an uploaded document as (content hash, text extractor).
+
+    PDF pages are hashed on their raw content stream plus the resources it draws
+    (fonts and form XObjects, followed recursively), so unchanged pages are
+    recognized without running text extraction on them. DOCX and TXT files have
+    no pages and are treated as a single page.
+    """
+    if file_extension == 'pdf':
+        reader = PdfReader(upload_path)
+        memo = {}
+        pages = []
+        for page in reader.pages:
+            contents = page.get_contents()
+            data = contents.get_data() if contents is not None else b''
+            pages.append((page_hash(data + _resources_digest(page, memo)),
+                          lambda page=page: px.clean_page_text(page.extract_text())))
+        return pages
+
+    if file_extension == 'docx':
+        text = dx.extract_docx_text(upload_path)
+    elif file_extension == 'txt':
+        with open(upload_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    else:
+        raise ValueError(f"Unsupported file type: {file_extension}")
+    return [(page_hash(text.encode('utf-8')), lambda: text)]
+
+
+def diff_events(old_events: List[Dict], new_events: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Compare two versions of a document's events.
+
+    Events are matched on (date, context). An event whose context survives with a
+    different date is reported as moved rather than as a removal plus an addition.
+
+    Returns:
+        dict: 'added', 'removed' and 'moved' lists
+    """
+    def key(event):
+        return event['date'], event['context']
+
+    old_counts = Counter(map(key, old_events))
+    new_counts = Counter(map(key, new_events))
+
+    removed = []
+    remaining = old_counts - new_counts
+    for event in old_events:
+        if remaining[key(event)] > 0:
+            remaining[key(event)] -= 1
+            removed.append(event)
+
+    added = []
+    remaining = new_counts - old_counts
+    for event in new_events:
+        if remaining[key(event)] > 0:
+            remaining[key(event)] -= 1
+            added.append(event)
+
+    # Pair removals and additions that share a context, in document order
+    removed_by_context = defaultdict(list)
+    for event in removed:
+        removed_by_context[event['context']].append(event)
+
+    moved = []
+    still_added = []
+    for event in added:
+        candidates = removed_by_context.get(event['context'])
+        if candidates:
+            previous = candidates.pop(0)
+            moved.append({'context': event['context'], 'from': previous['date'],
+                          'to': event['date'], 'page': event.get('page')})
+        else:
+            still_added.append(event)
+
+    still_removed = [event for events in removed_by_context.values() for event in events]
+    still_removed.sort(key=lambda event: (event['date'], event['context']))
+
+    return {'added': still_added, 'removed': still_removed, 'moved': moved}
+
+
+def reparse_document(upload_path: str, file_extension: str, store: DocumentStore,
+                     name: str, doc_id: str, default_year: Optional[int] = None) -> Dict:
+    """
+    Parse an uploaded document into the store, re-extracting and re-scanning only
+    the pages that changed since the previous upload under the same name.
+
+    Args:
+        upload_path (str): Path to the uploaded file
+        file_extension (str): 'pdf', 'docx' or 'txt'
+        store (DocumentStore): Store receiving the parsed pages
+        name (str): Original filename, used to find the previous version
+        doc_id (str): Content hash of the upload
+        default_year (int): Year for dates written without one (defaults to the current year)
+
+    Returns:
+        dict: 'events' (all events, sorted by date), 'delta' (added/removed/moved
+              events relative to the previous version) and 'pages' (page counts)
+    """
+    # The reservation stops a concurrent upload from dropping doc_id between the
+    # check below and publishing it as the latest version of name
+    with store.reserve(doc_id):
+        previous_id = store.latest(name)
+        previous_pages = []
+        if previous_id and store.exists(previous_id):
+            previous_pages = (store.load_manifest(previous_id) or {}).get('pages', [])
+
+        manifest = store.load_manifest(doc_id) if store.exists(doc_id) else None
+        if manifest is not None:
+            # Identical bytes were parsed before (under this or another name)
+            manifest_pages = manifest['pages']
+            reparsed = 0
+            # Kept so the pages can be stored again if they vanish before publishing
+            with store.open(doc_id) as document:
+                page_texts = list(document.iter_pages())
+                paged = document.paged
+        else:
+            pages = _document_pages(upload_path, file_extension)
+            # A hash shared by several previous pages cannot tell them apart; treat it as a miss
+            hash_counts = Counter(page['hash'] for page in previous_pages)
+            previous_by_hash = {page['hash']: index for index, page in enumerate(previous_pages)
+                                if hash_counts[page['hash']] == 1}
+
+            page_texts = []
+            manifest_pages = []
+            reparsed = 0
+            try:
+                previous_document = store.open(previous_id) if previous_by_hash else nullcontext()
+            except FileNotFoundError:
+                # A concurrent upload of the same name already replaced and dropped it
+                previous_document, previous_by_hash = nullcontext(), {}
+            with previous_document as previous:
+                for content_hash, extract_text in pages:
+                    previous_index = previous_by_hash.get(content_hash)
+                    if previous_index is not None:
+                        # Read just this page back from the previous version
+                        text = previous.get_page(previous_index + 1)
+                        page_events = previous_pages[previous_index]['events']
+                    else:
+                        text = extract_text()
+                        page_events = extract_events_from_text(text, name, default_year).to_records()
+                        reparsed += 1
+                    page_texts.append(text)
+                    manifest_pages.append({'hash': content_hash, 'events': page_events})
+
+            manifest = {'name': name, 'pages': manifest_pages}
+            paged = file_extension == 'pdf'
+            store.put(doc_id, page_texts, manifest, paged=paged)
+        store.set_latest(name, doc_id, page_texts, manifest, paged)
+
+    def with_pages(manifest_pages):
+        return [{**event, 'page': page_num}
+                for page_num, page in enumerate(manifest_pages, 1)
+                for event in page['events']]
+
+    new_events = with_pages(manifest_pages)
+    events = EventBatch.from_records(new_events, source=name).dedupe().sort()
+    logger.info(f"Re-parsed {reparsed} of {len(manifest_pages)} pages of {name}")
+
+    return {
+        'events': events.to_records(),
+        'delta': diff_events(with_pages(previous_pages), new_events),
+        'pages': {'total': len(manifest_pages), 'reparsed': reparsed},
+    }
@@ -1,7 +1,9 @@
+import os
 import re
-from datetime import datetime
+from datetime import date, datetime
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
+from events import Event, EventBatch
 
 def extract_dates_from_syllabus(file_path: str) -> List[Dict[str, str]]:
     """
@@ -11,7 +13,20 @@ def extract_dates_from_syllabus(file_path: str) -> List[Dict[str, str]]:
         file_path (str): Path to the text file containing syllabus content
     
     Returns:
-        List of dictionaries containing date information
+        List of dictionaries containing date information (dates as YYYY-MM-DD)
+    """
+    return extract_events_from_syllabus(file_path).to_records()
+
+def extract_events_from_syllabus(file_path: str, default_year: Optional[int] = None) -> EventBatch:
+    """
+    Extract important dates and events from the syllabus as a columnar batch
+    
+    Args:
+        file_path (str): Path to the text file containing syllabus content
+        default_year (int): Year for dates written without one (defaults to the current year)
+    
+    Returns:
+        EventBatch of unique events in extraction order
     """
     # Configure logging
     logging.basicConfig(level=logging.INFO)
@@ -22,70 +37,85 @@ def extract_dates_from_syllabus(file_path: str) -> List[Dict[str, str]]:
         with open(file_path, 'r', encoding='utf-8') as f:
             syllabus_text = f.read()
 
-        # Date extraction patterns
-        important_dates = []
-
-        # Pattern for dates in specific formats
-        date_patterns = [
-            # Month Day, Year format
-            r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})\b',
-            # Month/Day/Year format
-            r'\b(\d{1,2}/\d{1,2}/\d{4})\b'
-        ]
-
-        # Specific date contexts to look for
-        date_contexts = [
-            r'Course Start',
-            r'Midterm Project',
-            r'Fall Break',
-            r'Final Presentations',
-            r'Final Project',
-            r'Lab \d+',
-            r'Week \d+',
-            r'Office Hours'
-        ]
-
-        # Extract dates with their contexts
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, syllabus_text)
-            for match in matches:
-                # Find nearby context
-                start = max(0, match.start() - 100)
-                end = min(len(syllabus_text), match.end() + 100)
-                context_area = syllabus_text[start:end]
-                
-                # Check if the date is near any of the specific contexts
-                for context_pattern in date_contexts:
-                    context_match = re.search(context_pattern, context_area, re.IGNORECASE)
-                    if context_match:
-                        important_dates.append({
-                            'date': match.group(0),
-                            'context': context_match.group(0)
-                        })
-
-        # Additional specific date extraction for academic calendar
-        calendar_pattern = r'(\d+/\d+)\s+(.+?)\s+(Lab \d+:.+)'
-        calendar_matches = re.finditer(calendar_pattern, syllabus_text, re.MULTILINE)
-        for match in calendar_matches:
-            important_dates.append({
-                'date': match.group(1),
-                'context': f"{match.group(2)} - {match.group(3)}"
-            })
-
-        # Remove duplicates
-        unique_dates = []
-        seen = set()
-        for date_info in important_dates:
-            key = (date_info['date'], date_info['context'])
-            if key not in seen:
-                unique_dates.append(date_info)
-                seen.add(key)
-
-        return unique_dates
+        return extract_events_from_text(syllabus_text, os.path.basename(file_path), default_year)
 
     except Exception as e:
         logger.error(f"Error extracting dates: {e}")
-        return []
+        return EventBatch.empty()
+
+def extract_events_from_text(syllabus_text: str, source: str = '',
+                             default_year: Optional[int] = None) -> EventBatch:
+    """
+    Extract important dates and events from syllabus text (a whole document or a single page)
+    
+    Args:
+        syllabus_text (str): Syllabus content
+        source (str): Document name recorded on each event
+        default_year (int): Year for dates written without one (defaults to the current year)
+    
+    Returns:
+        EventBatch of unique events in extraction order
+    """
+    # Date extraction patterns
+    important_dates = []
+    default_year = default_year or datetime.now().year
+
+    # Pattern for dates in specific formats
+    date_patterns = [
+        # Month Day, Year format
+        r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})\b',
+        # Month/Day/Year format
+        r'\b(\d{1,2}/\d{1,2}/\d{4})\b'
+    ]
+
+    # Specific date contexts to look for
+    date_contexts = [
+        r'Course Start',
+        r'Midterm Project',
+        r'Fall Break',
+        r'Final Presentations',
+        r'Final Project',
+        r'Lab \d+',
+        r'Week \d+',
+        r'Office Hours'
+    ]
+
+    # Extract dates with their contexts
+    for pattern in date_patterns:
+        matches = re.finditer(pattern, syllabus_text)
+        for match in matches:
+            # Find nearby context
+            start = max(0, match.start() - 100)
+            end = min(len(syllabus_text), match.end() + 100)
+            context_area = syllabus_text[start:end]
+            
+            # Check if the date is near any of the specific contexts
+            for context_pattern in date_contexts:
+                context_match = re.search(context_pattern, context_area, re.IGNORECASE)
+                if context_match:
+                    event_date = _to_date(match.group(0), default_year)
+                    if event_date:
+                        important_dates.append(Event(event_date, context_match.group(0),
+                                                     context_area, source=source))
+
+    # Additional specific date extraction for academic calendar
+    calendar_pattern = r'(\d+/\d+)\s+(.+?)\s+(Lab \d+:.+)'
+    calendar_matches = re.finditer(calendar_pattern, syllabus_text, re.MULTILINE)
+    for match in calendar_matches:
+        event_date = _to_date(match.group(1), default_year)
+        if event_date:
+            important_dates.append(Event(event_date, f"{match.group(2)} - {match.group(3)}",
+                                         match.group(0), source=source))
+
+    # Remove duplicates
+    return EventBatch.from_events(important_dates).dedupe()
+
+def _to_date(date_str, default_year):
+    """
+    Parse a date string into a date object, or None if it cannot be parsed.
+    """
+    parsed = parse_date(date_str, default_year)
+    return date.fromisoformat(parsed) if parsed else None
 
 def parse_date(date_str, default_year):
     """
@@ -98,12 +128,11 @@ def parse_date(date_str, default_year):
     Returns:
         str: Parsed date in YYYY-MM-DD format or None if parsing fails
     """
-    # Date formats to try
+    # Date formats to try (separators are normalized below, so only '-' and ' ' appear)
     date_formats = [
-        "%m/%d/%Y", "%m/%d", 
         "%m-%d-%Y", "%m-%d",
-        "%B %d, %Y", "%B %d",
-        "%b %d, %Y", "%b %d"
+        "%B %d %Y", "%B %d",
+        "%b %d %Y", "%b %d"
     ]
 
     # Clean and standardize the date string
@@ -112,16 +141,17 @@ def parse_date(date_str, default_year):
                         .strip())
 
     for fmt in date_formats:
+        candidate = date_str
+        fmt_with_year = fmt
+        # If year is missing, use default year
+        if '%Y' not in fmt:
+            separator = '-' if '-' in fmt else ' '
+            candidate = f"{date_str}{separator}{default_year}"
+            fmt_with_year = f"{fmt}{separator}%Y"
+
         try:
-            # If year is missing, use default year
-            if '%Y' not in fmt:
-                if '/' in date_str or '-' in date_str:
-                    date_str = f"{date_str}-{default_year}"
-                else:
-                    date_str = f"{date_str} {default_year}"
-            
             # Parse the date
-            parsed_date = datetime.strptime(date_str, fmt)
+            parsed_date = datetime.strptime(candidate, fmt_with_year)
             return parsed_date.strftime("%Y-%m-%d")
         except ValueError:
             continue
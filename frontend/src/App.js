@@ -11,10 +11,10 @@ const App = () => {
   const [priorityAssignments, setPriorityAssignments] = useState([]);
   const [error, setError] = useState("");
 
-  const extractAssignments = async (parsedFilePath) => {
+  const extractAssignments = async (docId) => {
     try {
       const response = await axios.get(`http://127.0.0.1:5000/generate-report`, {
-        params: { file: parsedFilePath }
+        params: { doc: docId }
       });
       const { important_dates, upcoming_assignments } = response.data;
       
@@ -52,9 +52,9 @@ const App = () => {
         setUploadedFile(file);
         // setUploadMessage(response.data.message);
         
-        // get assignments from parsed file
-        if (response.data.parsed_path) {
-          extractAssignments(response.data.parsed_path);
+        // get assignments from the stored document
+        if (response.data.doc_id) {
+          extractAssignments(response.data.doc_id);
         }
       } catch (error) {
         console.error('File upload failed', error);
@@ -0,0 +1,485 @@
+import argparse
+import io
+import json
+import math
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+# Pause before a worker draws again after a report had no document to query
+SKIP_BACKOFF_S = 0.05
+
+TOPICS = [
+    "Introduction to the course", "Python Language Fundamentals", "Working with functions",
+    "Scientific & tabular data", "Data visualization", "Working with spatial data",
+    "Pulling data from the Web", "Version Control", "Graphical User Interface Design",
+]
+POLICY_SENTENCES = [
+    "Late submission for labs will be penalized 10% per day late.",
+    "Regular and punctual class attendance is expected.",
+    "Students should immediately report any problems to the instructor.",
+    "Make-up exams will not be given without proper formal documentation.",
+    "Office Hours: Tuesdays 6:00 - 7:00 PM or by appointment.",
+]
+
+
+def synthetic_pages(page_count: int, rng: random.Random) -> List[List[str]]:
+    """
+    Generate syllabus-like pages: a header, schedule rows with lab due dates and policy text.
+    """
+    pages = []
+    lab = 0
+    month, day = 8, 20
+    for page_num in range(1, page_count + 1):
+        lines = [f"LOAD{rng.randint(1000, 9999)} Course Syllabus Page {page_num}"]
+        for _ in range(rng.randint(6, 12)):
+            lines.append(f"{month}/{day} {rng.choice(TOPICS)} Lab {lab}: exercise {rng.randint(1, 99)}")
+            lab += 1
+            day += 7
+            if day > 28:
+                month, day = month % 12 + 1, day - 28
+        lines.extend(rng.choice(POLICY_SENTENCES) for _ in range(rng.randint(10, 25)))
+        if page_num == page_count:
+            lines.append(f"{month}/{day} Midterm Project - No Lecture!")
+            lines.append(f"{month}/{day + 7 if day < 21 else day} Final Project Due")
+        pages.append(lines)
+    return pages
+
+
+def make_txt(pages: List[List[str]]) -> bytes:
+    return '\n\n'.join('\n'.join(lines) for lines in pages).encode('utf-8')
+
+
+def make_docx(pages: List[List[str]]) -> bytes:
+    from docx import Document
+
+    document = Document()
+    for lines in pages:
+        for line in lines:
+            document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def make_pdf(pages: List[List[str]]) -> bytes:
+    """
+    Write a minimal PDF with one Helvetica text line per entry.
+    """
+    def escape(line):
+        return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    objects = {3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    next_id = 4
+    for lines in pages:
+        stream = ("BT /F1 9 Tf 11 TL 40 770 Td "
+                  + " ".join(f"({escape(line)}) Tj T*" for line in lines[:68])
+                  + " ET").encode('latin-1', 'replace')
+        page_id, content_id = next_id, next_id + 1
+        objects[page_id] = (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>").encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        kids.append(page_id)
+        next_id += 2
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = (f"<< /Type /Pages /Kids [{' '.join(f'{kid} 0 R' for kid in kids)}] "
+                  f"/Count {len(kids)} >>").encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id in range(1, next_id):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % next_id
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (next_id, xref)
+    return bytes(out)
+
+
+BUILDERS = {'txt': make_txt, 'docx': make_docx, 'pdf': make_pdf}
+
+
+class UploadSource:
+    def __init__(self, spec: Dict, base_dir: str, rng: random.Random):
+        """
+        Produce upload bodies for one entry of a scenario's mix.
+
+        Either replays a file from disk ('file') or generates a synthetic syllabus
+        ('format' and 'pages'). With 'unique', the last page gets a random line on
+        every request so the server cannot reuse an earlier parse of the same bytes;
+        only that page changes, which mirrors an instructor re-uploading a revision.
+        """
+        self.unique = spec.get('unique', False)
+        self.filename = spec.get('filename')
+        if 'file' in spec:
+            path = os.path.join(base_dir, spec['file'])
+            with open(path, 'rb') as f:
+                self.content = f.read()
+            self.format = path.rsplit('.', 1)[-1].lower()
+            self.filename = self.filename or os.path.basename(path)
+            self.pages = None
+        else:
+            self.format = spec['format']
+            self.pages = synthetic_pages(spec.get('pages', 5), rng)
+            self.content = BUILDERS[self.format](self.pages)
+            self.filename = self.filename or f"{spec['name']}.{self.format}"
+        self._rng = rng
+        self._lock = threading.Lock()
+
+    def body(self) -> bytes:
+        if not self.unique:
+            return self.content
+        if self.pages is None:
+            # Replayed files can only be varied for plain text
+            if self.format != 'txt':
+                return self.content
+            with self._lock:
+                return self.content + f"\nrevision {self._rng.getrandbits(64):x}\n".encode()
+        with self._lock:
+            nonce = f"Revision note {self._rng.getrandbits(64):x}"
+        pages = self.pages[:-1] + [self.pages[-1] + [nonce]]
+        return BUILDERS[self.format](pages)
+
+
+class LoadTest:
+    def __init__(self, base_url: str, scenario: Dict, base_dir: str):
+        """
+        Replay a weighted mix of /upload and /generate-report calls against a server.
+
+        :param base_url: Root URL of the backend
+        :param scenario: Parsed scenario file
+        :param base_dir: Directory that relative file paths in the scenario refer to
+        """
+        self.base_url = base_url.rstrip('/')
+        self.scenario = scenario
+        self.concurrency = scenario.get('concurrency', 8)
+        self.duration = scenario.get('duration_s', 30)
+        self.timeout = scenario.get('timeout_s', 120)
+        self.rng = random.Random(scenario.get('seed', 0))
+
+        self.mix = scenario['mix']
+        self.weights = [entry.get('weight', 1) for entry in self.mix]
+        self.sources = {
+            entry['name']: UploadSource(entry, base_dir, self.rng)
+            for entry in self.mix if entry['endpoint'] == 'upload'
+        }
+
+        # Latest (doc id, page count) per uploaded filename; the server drops superseded
+        # versions, so /generate-report only queries the current one
+        self.doc_ids = {}
+        self.results = []  # (name, start offset s, latency s, ok, status)
+        # Report draws that found no document to query; no request was sent, so
+        # they are kept out of the latency and throughput figures
+        self.skipped = Counter()
+        self._lock = threading.Lock()
+
+    def _upload(self, session: requests.Session, source: UploadSource,
+                filename: Optional[str] = None) -> Tuple[bool, str]:
+        filename = filename or source.filename
+        with self._lock:
+            # The server may drop the current version as soon as the new one arrives
+            self.doc_ids.pop(filename, None)
+        files = {'file': (filename, source.body(), 'application/octet-stream')}
+        response = session.post(f"{self.base_url}/upload", files=files, timeout=self.timeout)
+        if response.status_code == 200:
+            payload = response.json()
+            if payload.get('doc_id'):
+                # DOCX and TXT documents are stored as a single page
+                page_count = payload['pages']['total'] if source.format == 'pdf' else 1
+                with self._lock:
+                    self.doc_ids[filename] = (payload['doc_id'], page_count)
+        return response.status_code == 200, str(response.status_code)
+
+    def _report(self, session: requests.Session, entry: Dict,
+                rng: random.Random) -> Optional[Tuple[bool, str]]:
+        first, last = entry.get('page_range') or (1, 1)
+        with self._lock:
+            # Page-restricted reports only go to documents that have those pages
+            candidates = [doc_id for doc_id, page_count in self.doc_ids.values() if page_count >= last]
+        if not candidates:
+            return None
+        doc_id = rng.choice(candidates)
+        params = {'doc': doc_id}
+        if entry.get('page_range'):
+            params['pages'] = ','.join(str(page) for page in range(first, last + 1))
+        response = session.get(f"{self.base_url}/generate-report", params=params, timeout=self.timeout)
+        if response.status_code == 404:
+            with self._lock:
+                if all(doc_id != current for current, _ in self.doc_ids.values()):
+                    # Replaced by a newer upload while this request was in flight
+                    return False, '404 superseded'
+        return response.status_code == 200, str(response.status_code)
+
+    def seed(self) -> None:
+        """
+        Upload every source once so report requests have documents from the start.
+        """
+        with requests.Session() as session:
+            for name, source in self.sources.items():
+                ok, status = self._upload(session, source)
+                if not ok:
+                    print(f"Warning: seed upload '{name}' returned HTTP {status}")
+        if not self.doc_ids and any(entry['endpoint'] == 'generate-report' for entry in self.mix):
+            raise RuntimeError("No document could be uploaded; report requests have nothing to query")
+
+    def _worker(self, worker_id: int, start: float, deadline: float) -> None:
+        rng = random.Random(self.rng.random() + worker_id)
+        with requests.Session() as session:
+            while time.perf_counter() < deadline:
+                entry = rng.choices(self.mix, weights=self.weights)[0]
+                request_start = time.perf_counter()
+                try:
+                    if entry['endpoint'] == 'upload':
+                        # Each worker revises its own copy, so versions of one filename
+                        # are uploaded in order
+                        source = self.sources[entry['name']]
+                        ok, status = self._upload(session, source,
+                                                  f"w{worker_id}-{source.filename}")
+                    else:
+                        outcome = self._report(session, entry, rng)
+                        if outcome is None:
+                            with self._lock:
+                                self.skipped[entry['name']] += 1
+                            time.sleep(SKIP_BACKOFF_S)
+                            continue
+                        ok, status = outcome
+                except requests.RequestException as e:
+                    ok, status = False, type(e).__name__
+                latency = time.perf_counter() - request_start
+                self.results.append((entry['name'], request_start - start, latency, ok, status))
+
+    def run(self) -> float:
+        """
+        Run the closed-loop load for the scenario's duration.
+
+        Returns:
+            float: Wall-clock seconds the load ran for
+        """
+        start = time.perf_counter()
+        deadline = start + self.duration
+        threads = [threading.Thread(target=self._worker, args=(worker_id, start, deadline))
+                   for worker_id in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+
+class RssSampler:
+    def __init__(self, pid: int, interval: float = 1.0):
+        """
+        Sample a process's resident set size from /proc in a background thread.
+        """
+        self.pid = pid
+        self.interval = interval
+        self.samples = []  # (seconds since start, RSS in MB)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def read_rss_mb(self) -> Optional[float]:
+        try:
+            with open(f"/proc/{self.pid}/status", 'r') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            return None
+        return None
+
+    def _run(self) -> None:
+        start = time.perf_counter()
+        while not self._stop.is_set():
+            rss = self.read_rss_mb()
+            if rss is not None:
+                self.samples.append((time.perf_counter() - start, rss))
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(results: List[Tuple], elapsed: float, rss_samples: List[Tuple[float, float]],
+              skipped: Optional[Dict[str, int]] = None) -> Dict:
+    grouped = defaultdict(list)
+    for result in results:
+        grouped[result[0]].append(result)
+    grouped['ALL'] = list(results)
+
+    requests_summary = {}
+    for name, rows in grouped.items():
+        latencies = sorted(row[2] * 1000 for row in rows)
+        errors = Counter(row[4] for row in rows if not row[3])
+        requests_summary[name] = {
+            'count': len(rows),
+            'throughput_rps': len(rows) / elapsed if elapsed else 0.0,
+            'error_rate': sum(errors.values()) / len(rows) if rows else 0.0,
+            'errors': dict(errors),
+            'p50_ms': percentile(latencies, 50),
+            'p95_ms': percentile(latencies, 95),
+            'p99_ms': percentile(latencies, 99),
+            'max_ms': latencies[-1] if latencies else 0.0,
+        }
+
+    rss_values = [rss for _, rss in rss_samples]
+    return {
+        'elapsed_s': elapsed,
+        'requests': requests_summary,
+        'skipped': dict(skipped or {}),
+        'rss_mb': {
+            'start': rss_values[0] if rss_values else None,
+            'peak': max(rss_values) if rss_values else None,
+            'end': rss_values[-1] if rss_values else None,
+            'timeline': [[round(t, 1), round(rss, 1)] for t, rss in rss_samples],
+        },
+    }
+
+
+def print_summary(summary: Dict, scenario: Dict) -> None:
+    print(f"\nScenario '{scenario.get('name', 'unnamed')}': {summary['elapsed_s']:.1f}s "
+          f"at concurrency {scenario.get('concurrency', 8)}")
+    print(f"{'request':<24}{'count':>7}{'req/s':>8}{'errors':>8}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for name, stats in summary['requests'].items():
+        print(f"{name:<24}{stats['count']:>7}{stats['throughput_rps']:>8.1f}"
+              f"{stats['error_rate']:>8.1%}{stats['p50_ms']:>9.0f}"
+              f"{stats['p95_ms']:>9.0f}{stats['p99_ms']:>9.0f}")
+        if stats['errors']:
+            print(f"{'':<24}errors by status: {stats['errors']}")
+    if summary['skipped']:
+        print(f"Not sent (no document with enough pages): {summary['skipped']}")
+
+    rss = summary['rss_mb']
+    if rss['start'] is not None:
+        print(f"\nServer RSS: start {rss['start']:.0f} MB, peak {rss['peak']:.0f} MB, "
+              f"end {rss['end']:.0f} MB")
+        # Print roughly ten evenly spaced samples
+        timeline = rss['timeline']
+        step = max(1, len(timeline) // 10)
+        print("  " + "  ".join(f"{t:.0f}s:{value:.0f}MB" for t, value in timeline[::step]))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(data_dir: str, port: int) -> Tuple[subprocess.Popen, str]:
+    """
+    Start the Flask backend without the debugger/reloader, storing its files in data_dir.
+    """
+    env = dict(os.environ,
+               SYLLABUS_UPLOAD_FOLDER=os.path.join(data_dir, 'uploads'),
+               SYLLABUS_PARSED_FOLDER=os.path.join(data_dir, 'parsed'))
+    log_path = os.path.join(data_dir, 'server.log')
+    with open(log_path, 'wb') as log:
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'flask', '--app', 'app', 'run', '--host', '127.0.0.1',
+             '--port', str(port), '--no-reload', '--with-threads'],
+            cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited during startup; see {log_path}")
+        try:
+            requests.get(f"{base_url}/generate-report", timeout=1)
+            return process, base_url
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"Server did not start within 60s; see {log_path}")
+
+
+def main():
+    """
+    Run a load-test scenario against a locally started (or already running) backend
+    """
+    parser = argparse.ArgumentParser(description="Replay upload/report traffic against the backend")
+    parser.add_argument('scenario', help="Scenario JSON file")
+    parser.add_argument('--url', help="Target an already running server instead of starting one")
+    parser.add_argument('--pid', type=int, help="PID to sample RSS from when using --url")
+    parser.add_argument('--concurrency', type=int, help="Override the scenario's concurrency")
+    parser.add_argument('--duration', type=float, help="Override the scenario's duration in seconds")
+    parser.add_argument('--output', help="Write the full summary as JSON to this file")
+    parser.add_argument('--keep-data', action='store_true',
+                        help="Keep the started server's upload/parsed folders and log")
+    args = parser.parse_args()
+
+    with open(args.scenario, 'r', encoding='utf-8') as f:
+        scenario = json.load(f)
+    if args.concurrency:
+        scenario['concurrency'] = args.concurrency
+    if args.duration:
+        scenario['duration_s'] = args.duration
+
+    data_dir = None
+    process = None
+    try:
+        if args.url:
+            base_url, pid = args.url, args.pid
+        else:
+            data_dir = tempfile.mkdtemp(prefix='syllabus-loadtest-')
+            process, base_url = start_server(data_dir, free_port())
+            pid = process.pid
+            print(f"Started backend at {base_url} (pid {pid}, data in {data_dir})")
+
+        load_test = LoadTest(base_url, scenario, os.path.dirname(os.path.abspath(args.scenario)))
+        load_test.seed()
+
+        sampler = RssSampler(pid, scenario.get('rss_interval_s', 1.0)) if pid else None
+        if sampler:
+            sampler.start()
+        elapsed = load_test.run()
+        if sampler:
+            sampler.stop()
+
+        summary = summarize(load_test.results, elapsed, sampler.samples if sampler else [],
+                            load_test.skipped)
+        print_summary(summary, scenario)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump({'scenario': scenario, **summary}, f, indent=2)
+            print(f"\nWrote {args.output}")
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if data_dir and not args.keep_data:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
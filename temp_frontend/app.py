@@ -1,57 +1,77 @@
 import streamlit as st
-import requests
-import os
 import pandas as pd
-from datetime import datetime
 import icalendar
-import sys
 
 # Import custom calendar component
 from calendar_component import CalendarComponent
 
-# Import backend processing
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from backend.scanner import extract_dates_from_syllabus
+# Import backend HTTP client
+from backend_client import BackendClient
 
-def process_syllabus(uploaded_file):
+@st.cache_resource
+def get_backend_client():
     """
-    Upload syllabus to backend and extract important dates
+    Share one pooled backend client across Streamlit reruns and sessions
     """
-    # Prepare file for upload
-    files = {'file': (uploaded_file.name, uploaded_file, uploaded_file.type)}
-    
-    try:
-        # Upload file to backend
-        response = requests.post("http://127.0.0.1:5000/upload", files=files)
-        
-        # Check if upload was successful
-        if response.status_code != 200:
-            st.error(f"Upload failed: {response.json().get('error', 'Unknown error')}")
-            return []
-        
-        # Get the parsed file path from the response
-        parsed_path = response.json().get('parsed_path')
-        
-        # Extract dates from the parsed file
-        important_dates = extract_dates_from_syllabus(parsed_path)
-        
-        # Transform dates into a format suitable for the calendar
-        formatted_events = [
-            {
-                "title": date_info.get('context', 'Event'),
-                "start_date": datetime.strptime(date_info['date'], "%Y-%m-%d"),
-                "description": date_info.get('context', '')
-            }
-            for date_info in important_dates
-            if date_info.get('date')
-        ]
-        
-        return formatted_events
-    
-    except Exception as e:
-        st.error(f"Error processing syllabus: {e}")
+    return BackendClient()
+
+def process_syllabi(uploaded_files):
+    """
+    Upload new syllabi to the backend in parallel and collect their important dates
+
+    Results are kept in the session per uploaded file, so Streamlit reruns (sidebar
+    clicks, downloads) only upload files that have not been sent yet
+    """
+    if 'upload_results' not in st.session_state:
+        st.session_state.upload_results = {}
+    upload_results = st.session_state.upload_results
+
+    # Prepare files that have not been uploaded in this session
+    new_files = [uploaded_file for uploaded_file in uploaded_files
+                 if uploaded_file.file_id not in upload_results]
+    uploads = [
+        {
+            'filename': uploaded_file.name,
+            'content': uploaded_file.getvalue(),
+            'content_type': uploaded_file.type
+        }
+        for uploaded_file in new_files
+    ]
+
+    for uploaded_file, result in zip(new_files, get_backend_client().upload_many(uploads)):
+        upload_results[uploaded_file.file_id] = result
+
+    # Forget files that were removed from the uploader
+    current_ids = {uploaded_file.file_id for uploaded_file in uploaded_files}
+    for file_id in list(upload_results):
+        if file_id not in current_ids:
+            del upload_results[file_id]
+
+    results = [upload_results[uploaded_file.file_id] for uploaded_file in uploaded_files]
+
+    event_frames = []
+    for result in results:
+        # Report failed uploads without discarding the rest of the batch
+        if 'error' in result:
+            st.error(f"Upload failed for {result['filename']}: {result['error']}")
+            continue
+
+        if result.get('events'):
+            event_frames.append(pd.DataFrame(result['events'], columns=['date', 'context']))
+
+    if not event_frames:
         return []
 
+    # Transform dates into a format suitable for the calendar, one column at a time
+    events_df = pd.concat(event_frames, ignore_index=True)
+    formatted_events = pd.DataFrame({
+        "title": events_df['context'].fillna('Event'),
+        "start_date": pd.to_datetime(events_df['date'], format="%Y-%m-%d"),
+        "description": events_df['context'].fillna(''),
+    }).sort_values("start_date", kind="stable")
+
+    return formatted_events.to_dict('records')
+
 def generate_ical(events):
     """
     Generate an iCal file from events
@@ -106,17 +126,18 @@ def main():
                 st.sidebar.write(f"• {date}")
 
     with main_content:
-        # File uploader for syllabus
-        uploaded_file = st.file_uploader("Upload Syllabus", type=['docx', 'pdf'])
+        # File uploader for syllabi (a whole semester can be dropped at once)
+        uploaded_files = st.file_uploader("Upload Syllabus", type=['docx', 'pdf'],
+                                          accept_multiple_files=True)
 
         # Initialize events list
         if 'syllabus_events' not in st.session_state:
             st.session_state.syllabus_events = []
 
-        # Process uploaded syllabus
-        if uploaded_file:
-            # Extract events from syllabus
-            events = process_syllabus(uploaded_file)
+        # Process uploaded syllabi
+        if uploaded_files:
+            # Extract events from syllabi
+            events = process_syllabi(uploaded_files)
 
             if events:
                 # Store events in session state
@@ -0,0 +1,161 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = os.environ.get("SYLLABUS_BACKEND_URL", "http://127.0.0.1:5000")
+
+
+class BackendError(Exception):
+    """
+    Raised when the backend rejects a request or cannot be reached.
+    """
+
+
+class BackendClient:
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, pool_size: int = 8,
+                 connect_timeout: float = 3.05, read_timeout: float = 120.0,
+                 max_retries: int = 3, backoff_factor: float = 0.5):
+        """
+        Create a client that talks to the Flask backend over a pooled, keep-alive session.
+
+        :param base_url: Root URL of the backend (defaults to $SYLLABUS_BACKEND_URL)
+        :param pool_size: Maximum number of concurrent connections kept open to the backend
+        :param connect_timeout: Seconds to wait for a connection to be established
+        :param read_timeout: Seconds to wait for the backend to respond (parsing can be slow)
+        :param max_retries: Number of retries for connection errors and 502/503/504 responses
+                            (uploads: connection errors and 503 only)
+        :param backoff_factor: Exponential backoff factor between retries
+        """
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+
+        # Reads are safe to repeat: retry connection failures and gateway errors
+        read_retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        # Uploads are only retried when the backend never started on them (connection
+        # refused or 503); after a read timeout the parse may still be running, and
+        # sending the file again would only add another full parse to a busy server
+        upload_retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(503,),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+
+        self.session = self._pooled_session(read_retry)
+        self.upload_session = self._pooled_session(upload_retry)
+
+    def _pooled_session(self, retry: Retry) -> requests.Session:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        self.session.close()
+        self.upload_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _request(self, method: str, path: str, **kwargs) -> Dict:
+        """
+        Send a request to the backend and return the decoded JSON body.
+
+        :raises BackendError: If the backend is unreachable or returns an error status
+        """
+        url = f"{self.base_url}{path}"
+        try:
+            session = self.upload_session if method == "POST" else self.session
+            response = session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            raise BackendError(f"Could not reach backend at {url}: {e}") from e
+
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {}
+
+        if response.status_code != 200:
+            message = payload.get('error', f"HTTP {response.status_code}")
+            raise BackendError(message)
+
+        return payload
+
+    def upload(self, filename: str, content: bytes, content_type: Optional[str] = None) -> Dict:
+        """
+        Upload a single syllabus and return the backend's structured result.
+
+        :param filename: Original name of the file (its extension selects the parser)
+        :param content: Raw file bytes
+        :param content_type: MIME type of the file
+        :return: Response body containing 'doc_id' and the extracted 'events'
+        """
+        files = {'file': (filename, content, content_type or 'application/octet-stream')}
+        return self._request("POST", "/upload", files=files)
+
+    def upload_many(self, uploads: List[Dict], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Upload several syllabi concurrently over the shared connection pool.
+
+        :param uploads: List of dicts with 'filename', 'content' and optional 'content_type'
+        :param max_workers: Number of parallel uploads (defaults to the pool size)
+        :return: One result per upload, in input order. Failed uploads are returned as
+                 {'filename': ..., 'error': ...} instead of raising, so one bad file does
+                 not discard the rest of the batch.
+        """
+        def upload_one(item: Dict) -> Dict:
+            try:
+                result = self.upload(item['filename'], item['content'], item.get('content_type'))
+            except BackendError as e:
+                logger.error(f"Upload of {item['filename']} failed: {e}")
+                return {'filename': item['filename'], 'error': str(e)}
+            result['filename'] = item['filename']
+            return result
+
+        if not uploads:
+            return []
+
+        workers = min(max_workers or self.pool_size, self.pool_size, len(uploads))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(upload_one, uploads))
+
+    def generate_report(self, doc_id: str, pages: Optional[List[int]] = None) -> Dict:
+        """
+        Request the assignment/important-date report for an uploaded syllabus.
+
+        :param doc_id: 'doc_id' value returned by a previous upload
+        :param pages: Restrict the report to these page numbers (default: whole document)
+        :return: Dictionary containing 'upcoming_assignments' and 'important_dates'
+        """
+        params = {'doc': doc_id}
+        if pages:
+            params['pages'] = ','.join(str(page) for page in pages)
+        return self._request("GET", "/generate-report", params=params)